@@ -1,9 +1,10 @@
 import os
-from typing import Dict, Any
-from dataclasses import dataclass
-from pathlib import Path
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+from dataclasses import dataclass, asdict
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """API configuration settings"""
     base_url: str
@@ -12,7 +13,7 @@ class APIConfig:
     api_key_header: str = "X-API-Key"
     content_type: str = "application/json"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database configuration settings"""
     host: str
@@ -22,7 +23,7 @@ class DatabaseConfig:
     password: str
     connection_pool_size: int = 10
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration settings"""
     level: str = "INFO"
@@ -31,7 +32,7 @@ class LoggingConfig:
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Main application configuration"""
     name: str = "Anubis Forensics"
@@ -41,101 +42,164 @@ class AppConfig:
     temp_dir: str = "temp"
     max_file_size: int = 100 * 1024 * 1024  # 100MB
 
+# Numeric environment settings: (variable, cast, default)
+_NUMERIC_SCHEMA = (
+    ("API_TIMEOUT", int, 30),
+    ("API_RETRY_ATTEMPTS", int, 3),
+    ("DB_PORT", int, 5432),
+    ("DB_POOL_SIZE", int, 10),
+    ("LOG_MAX_SIZE", int, 10 * 1024 * 1024),
+    ("LOG_BACKUP_COUNT", int, 5),
+    ("MAX_FILE_SIZE", int, 100 * 1024 * 1024),
+)
+
 class Config:
     """Centralized configuration management"""
-    
+
+    _instance = None
+
+    def __new__(cls):
+        """Return the shared instance, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
+        # Repeated Config() calls must not re-parse env or re-create dirs
+        if getattr(self, "_initialized", False):
+            return
         self._load_environment()
         self._setup_directories()
+        self._initialized = True
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Sections are frozen dataclasses; keep the container read-only too
+        if getattr(self, "_initialized", False):
+            raise AttributeError(f"Config is read-only; cannot set '{name}'")
+        super().__setattr__(name, value)
     
     def _load_environment(self):
-        """Load configuration from environment variables"""
-        # API Configuration
-        self.api = APIConfig(
-            base_url=os.getenv("API_BASE_URL", "http://localhost:8000/api/v1"),
-            timeout=int(os.getenv("API_TIMEOUT", "30")),
-            retry_attempts=int(os.getenv("API_RETRY_ATTEMPTS", "3")),
-            api_key_header=os.getenv("API_KEY_HEADER", "X-API-Key"),
-            content_type=os.getenv("API_CONTENT_TYPE", "application/json")
+        """Snapshot environment variables; sections are parsed on first access"""
+        self._env = os.environ.copy()
+    
+    @functools.cached_property
+    def _numeric(self) -> Dict[str, int]:
+        """Numeric settings, cast in a single pass over the schema"""
+        env = self._env
+        return {
+            name: cast(env[name]) if name in env else default
+            for name, cast, default in _NUMERIC_SCHEMA
+        }
+    
+    @functools.cached_property
+    def api(self) -> APIConfig:
+        """API configuration"""
+        env = self._env
+        numeric = self._numeric
+        return APIConfig(
+            base_url=env.get("API_BASE_URL", "http://localhost:8000/api/v1"),
+            timeout=numeric["API_TIMEOUT"],
+            retry_attempts=numeric["API_RETRY_ATTEMPTS"],
+            api_key_header=env.get("API_KEY_HEADER", "X-API-Key"),
+            content_type=env.get("API_CONTENT_TYPE", "application/json")
         )
-        
-        # Database Configuration
-        self.database = DatabaseConfig(
-            host=os.getenv("DB_HOST", "localhost"),
-            port=int(os.getenv("DB_PORT", "5432")),
-            database=os.getenv("DB_NAME", "anubis_forensics"),
-            username=os.getenv("DB_USER", "postgres"),
-            password=os.getenv("DB_PASSWORD", ""),
-            connection_pool_size=int(os.getenv("DB_POOL_SIZE", "10"))
+    
+    @functools.cached_property
+    def database(self) -> DatabaseConfig:
+        """Database configuration"""
+        env = self._env
+        numeric = self._numeric
+        return DatabaseConfig(
+            host=env.get("DB_HOST", "localhost"),
+            port=numeric["DB_PORT"],
+            database=env.get("DB_NAME", "anubis_forensics"),
+            username=env.get("DB_USER", "postgres"),
+            password=env.get("DB_PASSWORD", ""),
+            connection_pool_size=numeric["DB_POOL_SIZE"]
         )
-        
-        # Logging Configuration
-        self.logging = LoggingConfig(
-            level=os.getenv("LOG_LEVEL", "INFO"),
-            format=os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            file_path=os.getenv("LOG_FILE", "logs/app.log"),
-            max_file_size=int(os.getenv("LOG_MAX_SIZE", str(10 * 1024 * 1024))),
-            backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    
+    @functools.cached_property
+    def logging(self) -> LoggingConfig:
+        """Logging configuration"""
+        env = self._env
+        numeric = self._numeric
+        return LoggingConfig(
+            level=env.get("LOG_LEVEL", "INFO"),
+            format=env.get("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+            file_path=env.get("LOG_FILE", "logs/app.log"),
+            max_file_size=numeric["LOG_MAX_SIZE"],
+            backup_count=numeric["LOG_BACKUP_COUNT"]
         )
-        
-        # Application Configuration
-        self.app = AppConfig(
-            name=os.getenv("APP_NAME", "Anubis Forensics"),
-            version=os.getenv("APP_VERSION", "1.0.0"),
-            debug=os.getenv("DEBUG", "False").lower() == "true",
-            data_dir=os.getenv("DATA_DIR", "data"),
-            temp_dir=os.getenv("TEMP_DIR", "temp"),
-            max_file_size=int(os.getenv("MAX_FILE_SIZE", str(100 * 1024 * 1024)))
+    
+    @functools.cached_property
+    def app(self) -> AppConfig:
+        """Application configuration"""
+        env = self._env
+        numeric = self._numeric
+        return AppConfig(
+            name=env.get("APP_NAME", "Anubis Forensics"),
+            version=env.get("APP_VERSION", "1.0.0"),
+            debug=env.get("DEBUG", "False").lower() == "true",
+            data_dir=env.get("DATA_DIR", "data"),
+            temp_dir=env.get("TEMP_DIR", "temp"),
+            max_file_size=numeric["MAX_FILE_SIZE"]
         )
     
     def _setup_directories(self):
         """Create necessary directories"""
-        directories = [
-            self.app.data_dir,
-            self.app.temp_dir,
-            os.path.dirname(self.logging.file_path)
+        directories = {
+            os.path.normpath(directory)
+            for directory in (
+                self.app.data_dir,
+                self.app.temp_dir,
+                os.path.dirname(self.logging.file_path)
+            )
+            if directory
+        }
+
+        # Only leaves need creating; makedirs brings their ancestors along
+        leaves = [
+            directory for directory in directories
+            if not any(
+                other.startswith(directory + os.sep) for other in directories
+            )
         ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+
+        for directory in leaves:
+            try:
+                os.stat(directory)
+                continue
+            except OSError:
+                pass
+            os.makedirs(directory, exist_ok=True)
     
     def get_api_endpoint(self, endpoint: str) -> str:
         """Get full API endpoint URL"""
         return f"{self.api.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
     
+    @functools.cached_property
+    def as_dict(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read-only configuration mapping, built once (password excluded)"""
+        return MappingProxyType({
+            "api": MappingProxyType(asdict(self.api)),
+            "database": MappingProxyType({
+                key: value
+                for key, value in asdict(self.database).items()
+                if key != "password"
+            }),
+            "logging": MappingProxyType(asdict(self.logging)),
+            "app": MappingProxyType(asdict(self.app))
+        })
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
-        return {
-            "api": {
-                "base_url": self.api.base_url,
-                "timeout": self.api.timeout,
-                "retry_attempts": self.api.retry_attempts,
-                "api_key_header": self.api.api_key_header,
-                "content_type": self.api.content_type
-            },
-            "database": {
-                "host": self.database.host,
-                "port": self.database.port,
-                "database": self.database.database,
-                "username": self.database.username,
-                "connection_pool_size": self.database.connection_pool_size
-            },
-            "logging": {
-                "level": self.logging.level,
-                "format": self.logging.format,
-                "file_path": self.logging.file_path,
-                "max_file_size": self.logging.max_file_size,
-                "backup_count": self.logging.backup_count
-            },
-            "app": {
-                "name": self.app.name,
-                "version": self.app.version,
-                "debug": self.app.debug,
-                "data_dir": self.app.data_dir,
-                "temp_dir": self.app.temp_dir,
-                "max_file_size": self.app.max_file_size
-            }
-        }
+        # Sections hold only scalars, so copying each one gives the caller a fully independent dict
+        return {section: dict(values) for section, values in self.as_dict.items()}
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the process-wide configuration, parsing the environment only once"""
+    return Config()
 
 # Global configuration instance
-config = Config() 
\ No newline at end of file
+config = get_config() 
\ No newline at end of file
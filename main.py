@@ -1,14 +1,20 @@
 import sys
+from PyQt5.QtCore import Qt, QCoreApplication, QThread, QThreadPool
 from PyQt5.QtWidgets import QApplication
 from pages.splash_screen import SplashScreen
-from pages.main_window import MainWindow
 
 def main():
+    # Lets QtWebEngineWidgets be imported after the app exists, so the web view can load lazily
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
+    # Background scans share one pool; leave a core free for the GUI thread
+    QThreadPool.globalInstance().setMaxThreadCount(max(2, QThread.idealThreadCount() - 1))
     window = None
 
     def show_main():
         nonlocal window
+        # Deferred so the splash shows before the page/service stack loads
+        from pages.main_window import MainWindow
         splash.close()
         window = MainWindow()
         window.showMaximized()
@@ -1,17 +1,47 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Any, Union, Mapping, Sequence, Callable
+from types import MappingProxyType
+from json.encoder import encode_basestring_ascii
 from datetime import datetime
+from array import array
 from enum import Enum
+import functools
+import json
+import operator
 import uuid
 
-class CaseStatus(Enum):
+# orjson is an optional, faster drop-in for bulk JSON ingest; output always
+# goes through json so escaping and separators match json.dumps
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+_json_dumps = functools.partial(json.dumps, separators=(",", ":"))
+
+def _new_id() -> str:
+    """Shared id factory for every model: a random UUID in its canonical 36-char form"""
+    return str(uuid.uuid4())
+
+# Shared read-only default for search fields that are usually left empty;
+# callers that need to mutate assign a fresh dict instead
+_EMPTY_MAPPING = MappingProxyType({})
+
+def _empty_mapping() -> Mapping[str, Any]:
+    return _EMPTY_MAPPING
+
+class _StrEnum(str, Enum):
+    """String-valued enum whose str() and format() give the value on every Python version"""
+    __str__ = str.__str__
+
+class CaseStatus(_StrEnum):
     """Case status enumeration"""
     DRAFT = "draft"
     ACTIVE = "active"
     COMPLETED = "completed"
     ARCHIVED = "archived"
 
-class EvidenceType(Enum):
+class EvidenceType(_StrEnum):
     """Evidence type enumeration"""
     FILE = "file"
     MEMORY = "memory"
@@ -20,14 +50,31 @@ class EvidenceType(Enum):
     LOG = "log"
     OTHER = "other"
 
-class AcquisitionType(Enum):
+class AcquisitionType(_StrEnum):
     """Acquisition type enumeration"""
     LOCAL = "local"
     REMOTE = "remote"
     LIVE = "live"
     DEAD = "dead"
 
-@dataclass
+# Value -> member lookups for the deserializers; a miss falls back to the
+# enum call so unknown values still raise ValueError
+_CASE_STATUS_MAP = CaseStatus._value2member_map_
+_EVIDENCE_TYPE_MAP = EvidenceType._value2member_map_
+
+class _IdentifiedModel:
+    """Equality and hashing by id for models that are collected in bulk"""
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+@dataclass(slots=True)
 class Location:
     """Location information for evidence"""
     path: str
@@ -37,10 +84,10 @@ class Location:
     hash: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
-class Evidence:
+@dataclass(slots=True, eq=False)
+class Evidence(_IdentifiedModel):
     """Evidence item model"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     name: str = ""
     type: EvidenceType = EvidenceType.FILE
     locations: List[Location] = field(default_factory=list)
@@ -53,10 +100,10 @@ class Evidence:
     tags: List[str] = field(default_factory=list)
     notes: Optional[str] = None
 
-@dataclass
-class Case:
+@dataclass(slots=True, eq=False)
+class Case(_IdentifiedModel):
     """Case model for forensic investigations"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     number: str = ""
     name: str = ""
     status: CaseStatus = CaseStatus.DRAFT
@@ -71,10 +118,10 @@ class Case:
     metadata: Dict[str, Any] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Remote acquisition agent model"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     name: str = ""
     location: str = ""
     version: Optional[str] = None
@@ -83,10 +130,10 @@ class Agent:
     capabilities: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class TargetMachine:
     """Target machine for remote acquisition"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     ip_address: str = ""
     domain: Optional[str] = None
     hostname: Optional[str] = None
@@ -96,10 +143,10 @@ class TargetMachine:
     credentials: Optional[Dict[str, str]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
-class AcquisitionSession:
+@dataclass(slots=True, eq=False)
+class AcquisitionSession(_IdentifiedModel):
     """Remote acquisition session model"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     case_id: str = ""
     agent_id: str = ""
     target_id: str = ""
@@ -113,10 +160,10 @@ class AcquisitionSession:
     parameters: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
-class User:
+@dataclass(slots=True, eq=False)
+class User(_IdentifiedModel):
     """User model"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     username: str = ""
     email: Optional[str] = None
     full_name: Optional[str] = None
@@ -126,68 +173,149 @@ class User:
     last_login: Optional[datetime] = None
     preferences: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class APIResponse:
     """Standard API response model"""
     success: bool = True
     data: Optional[Any] = None
     message: Optional[str] = None
     error_code: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+    @classmethod
+    def stamped(cls, **kwargs: Any) -> "APIResponse":
+        """Create a response stamped with the current time"""
+        kwargs.setdefault("timestamp", datetime.now())
+        return cls(**kwargs)
+
+@dataclass(slots=True)
 class SearchCriteria:
     """Search criteria for filtering data"""
     query: Optional[str] = None
-    filters: Dict[str, Any] = field(default_factory=dict)
+    filters: Mapping[str, Any] = field(default_factory=_empty_mapping)
     sort_by: Optional[str] = None
     sort_order: str = "asc"  # asc, desc
     page: int = 1
     page_size: int = 20
     include_deleted: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Search result model"""
-    items: List[Any] = field(default_factory=list)
+    items: Sequence[Any] = ()
     total_count: int = 0
     page: int = 1
     page_size: int = 20
     total_pages: int = 0
     has_next: bool = False
     has_previous: bool = False
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_mapping)
+
+# EvidenceType members in a fixed order so they can be stored as small ints
+_EVIDENCE_TYPES = tuple(EvidenceType)
+_EVIDENCE_TYPE_CODES = {member: code for code, member in enumerate(_EVIDENCE_TYPES)}
+
+class EvidenceTable:
+    """Column-oriented view of evidence items for bulk queries.
+
+    Holds the scalar fields used for filtering and aggregation as parallel
+    columns; sizes live in an unsigned 64-bit array with a presence mask so
+    sums and type filters avoid touching one Evidence object per row. Use
+    the Evidence dataclass for single-item API work.
+    """
+
+    __slots__ = ("ids", "names", "types", "sizes", "has_size", "hashes")
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.types = array("B")
+        self.sizes = array("Q")
+        self.has_size = array("B")
+        self.hashes: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_rows(cls, rows: List["Evidence"]) -> "EvidenceTable":
+        """Build a table from Evidence models"""
+        table = cls()
+        codes = _EVIDENCE_TYPE_CODES
+        table.ids = [row.id for row in rows]
+        table.names = [row.name for row in rows]
+        table.hashes = [row.hash for row in rows]
+        table.types = array("B", [codes[row.type] for row in rows])
+        table.sizes = array("Q", [row.size or 0 for row in rows])
+        table.has_size = array("B", [row.size is not None for row in rows])
+        return table
+
+    def to_rows(self) -> List["Evidence"]:
+        """Rebuild Evidence models from the tabled columns only"""
+        types = _EVIDENCE_TYPES
+        return [
+            Evidence(
+                id=item_id,
+                name=name,
+                type=types[type_code],
+                hash=item_hash,
+                size=size if known else None
+            )
+            for item_id, name, type_code, item_hash, size, known in zip(
+                self.ids, self.names, self.types, self.hashes,
+                self.sizes, self.has_size
+            )
+        ]
+
+    def total_size(self) -> int:
+        """Sum of all known sizes"""
+        return sum(self.sizes)
+
+    def indices_of_type(self, evidence_type: "EvidenceType") -> List[int]:
+        """Row indices whose type matches evidence_type"""
+        code = _EVIDENCE_TYPE_CODES[evidence_type]
+        return [index for index, value in enumerate(self.types) if value == code]
+
+    def count_by_type(self) -> Dict["EvidenceType", int]:
+        """Number of rows per evidence type"""
+        types = _EVIDENCE_TYPES
+        counts = [0] * len(types)
+        for code in self.types:
+            counts[code] += 1
+        return {types[code]: count for code, count in enumerate(counts) if count}
 
 # Utility functions for model operations
+def _field_names(cls, skip: Sequence[str] = ()) -> tuple:
+    """Names of a dataclass's fields in declaration order, minus skip"""
+    return tuple(f.name for f in fields(cls) if f.name not in skip)
+
+# Keys are derived from the dataclass fields so the serializers track model
+# changes; nested collections are summarised or converted separately
+_CASE_KEYS = _field_names(Case, skip=("evidence", "locations"))
+_case_fields = operator.attrgetter(*_CASE_KEYS)
+
 def case_to_dict(case: Case) -> Dict[str, Any]:
     """Convert Case model to dictionary"""
-    return {
-        "id": case.id,
-        "number": case.number,
-        "name": case.name,
-        "status": case.status.value,
-        "created_at": case.created_at.isoformat(),
-        "updated_at": case.updated_at.isoformat(),
-        "created_by": case.created_by,
-        "assigned_to": case.assigned_to,
-        "description": case.description,
-        "evidence_count": len(case.evidence),
-        "locations_count": len(case.locations),
-        "notes": case.notes,
-        "metadata": case.metadata,
-        "tags": case.tags
-    }
+    data = dict(zip(_CASE_KEYS, _case_fields(case)))
+    data["created_at"] = case.created_at.isoformat()
+    data["updated_at"] = case.updated_at.isoformat()
+    data["evidence_count"] = len(case.evidence)
+    data["locations_count"] = len(case.locations)
+    return data
 
 def dict_to_case(data: Dict[str, Any]) -> Case:
     """Convert dictionary to Case model"""
+    status = data.get("status", "draft")
+    created_at = data.get("created_at")
+    updated_at = data.get("updated_at")
     return Case(
-        id=data.get("id", str(uuid.uuid4())),
+        id=data["id"] if "id" in data else _new_id(),
         number=data.get("number", ""),
         name=data.get("name", ""),
-        status=CaseStatus(data.get("status", "draft")),
-        created_at=datetime.fromisoformat(data.get("created_at", datetime.now().isoformat())),
-        updated_at=datetime.fromisoformat(data.get("updated_at", datetime.now().isoformat())),
+        status=_CASE_STATUS_MAP.get(status) or CaseStatus(status),
+        created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else datetime.now(),
         created_by=data.get("created_by"),
         assigned_to=data.get("assigned_to"),
         description=data.get("description"),
@@ -196,32 +324,25 @@ def dict_to_case(data: Dict[str, Any]) -> Case:
         tags=data.get("tags", [])
     )
 
+_LOCATION_KEYS = _field_names(Location)
+_location_fields = operator.attrgetter(*_LOCATION_KEYS)
+
+_EVIDENCE_KEYS = _field_names(Evidence)
+_evidence_fields = operator.attrgetter(*_EVIDENCE_KEYS)
+
+def locations_to_dicts(locations: List[Location]) -> List[Dict[str, Any]]:
+    """Convert Location models to dictionaries"""
+    keys = _LOCATION_KEYS
+    getter = _location_fields
+    return [dict(zip(keys, getter(loc))) for loc in locations]
+
 def evidence_to_dict(evidence: Evidence) -> Dict[str, Any]:
     """Convert Evidence model to dictionary"""
-    return {
-        "id": evidence.id,
-        "name": evidence.name,
-        "type": evidence.type.value,
-        "locations": [
-            {
-                "path": loc.path,
-                "type": loc.type,
-                "description": loc.description,
-                "size": loc.size,
-                "hash": loc.hash,
-                "metadata": loc.metadata
-            }
-            for loc in evidence.locations
-        ],
-        "description": evidence.description,
-        "acquired_at": evidence.acquired_at.isoformat() if evidence.acquired_at else None,
-        "acquired_by": evidence.acquired_by,
-        "hash": evidence.hash,
-        "size": evidence.size,
-        "metadata": evidence.metadata,
-        "tags": evidence.tags,
-        "notes": evidence.notes
-    }
+    data = dict(zip(_EVIDENCE_KEYS, _evidence_fields(evidence)))
+    data["locations"] = locations_to_dicts(evidence.locations)
+    if evidence.acquired_at:
+        data["acquired_at"] = evidence.acquired_at.isoformat()
+    return data
 
 def dict_to_evidence(data: Dict[str, Any]) -> Evidence:
     """Convert dictionary to Evidence model"""
@@ -236,10 +357,11 @@ def dict_to_evidence(data: Dict[str, Any]) -> Evidence:
             metadata=loc_data.get("metadata", {})
         ))
     
+    evidence_type = data.get("type", "file")
     return Evidence(
-        id=data.get("id", str(uuid.uuid4())),
+        id=data["id"] if "id" in data else _new_id(),
         name=data.get("name", ""),
-        type=EvidenceType(data.get("type", "file")),
+        type=_EVIDENCE_TYPE_MAP.get(evidence_type) or EvidenceType(evidence_type),
         locations=locations,
         description=data.get("description"),
         acquired_at=datetime.fromisoformat(data["acquired_at"]) if data.get("acquired_at") else None,
@@ -249,4 +371,149 @@ def dict_to_evidence(data: Dict[str, Any]) -> Evidence:
         metadata=data.get("metadata", {}),
         tags=data.get("tags", []),
         notes=data.get("notes")
-    ) 
\ No newline at end of file
+    ) 
+
+def bulk_dict_to_case(rows: List[Dict[str, Any]]) -> List[Case]:
+    """Convert a list of dictionaries to Case models"""
+    _Case = Case
+    _CaseStatus = CaseStatus
+    _status_map = _CASE_STATUS_MAP
+    _fromiso = datetime.fromisoformat
+    _now = datetime.now
+
+    cases = []
+    append = cases.append
+    for data in rows:
+        get = data.get
+        status = get("status", "draft")
+        created_at = get("created_at")
+        updated_at = get("updated_at")
+        append(_Case(
+            id=data["id"] if "id" in data else _new_id(),
+            number=get("number", ""),
+            name=get("name", ""),
+            status=_status_map.get(status) or _CaseStatus(status),
+            created_at=_fromiso(created_at) if created_at else _now(),
+            updated_at=_fromiso(updated_at) if updated_at else _now(),
+            created_by=get("created_by"),
+            assigned_to=get("assigned_to"),
+            description=get("description"),
+            notes=get("notes"),
+            metadata=get("metadata", {}),
+            tags=get("tags", [])
+        ))
+    return cases
+
+def bulk_dict_to_evidence(rows: List[Dict[str, Any]]) -> List[Evidence]:
+    """Convert a list of dictionaries to Evidence models"""
+    _Evidence = Evidence
+    _Location = Location
+    _EType = EvidenceType
+    _type_map = _EVIDENCE_TYPE_MAP
+    _fromiso = datetime.fromisoformat
+
+    evidence = []
+    append = evidence.append
+    for data in rows:
+        get = data.get
+        evidence_type = get("type", "file")
+        acquired_at = get("acquired_at")
+        append(_Evidence(
+            id=data["id"] if "id" in data else _new_id(),
+            name=get("name", ""),
+            type=_type_map.get(evidence_type) or _EType(evidence_type),
+            locations=[
+                _Location(
+                    path=loc.get("path", ""),
+                    type=loc.get("type", "file"),
+                    description=loc.get("description"),
+                    size=loc.get("size"),
+                    hash=loc.get("hash"),
+                    metadata=loc.get("metadata", {})
+                )
+                for loc in get("locations", [])
+            ],
+            description=get("description"),
+            acquired_at=_fromiso(acquired_at) if acquired_at else None,
+            acquired_by=get("acquired_by"),
+            hash=get("hash"),
+            size=get("size"),
+            metadata=get("metadata", {}),
+            tags=get("tags", []),
+            notes=get("notes")
+        ))
+    return evidence
+
+def json_to_cases(payload: Union[str, bytes]) -> List[Case]:
+    """Parse a JSON array of cases into Case models"""
+    return bulk_dict_to_case(_json_loads(payload))
+
+def json_to_evidence(payload: Union[str, bytes]) -> List[Evidence]:
+    """Parse a JSON array of evidence items into Evidence models"""
+    return bulk_dict_to_evidence(_json_loads(payload))
+
+def _compile_json_serializer(
+    cls: type,
+    func_name: str,
+    overrides: Optional[Dict[str, str]] = None,
+    extras: Optional[Dict[str, str]] = None
+) -> Callable[[Any], str]:
+    """Generate a function that renders a model straight to a JSON string.
+
+    The field mapping is inlined into a single %-format, so no intermediate
+    dict is built. ``overrides`` maps a field name to a replacement value
+    expression (or None to drop the field); ``extras`` appends computed keys.
+    Expressions refer to the model instance as ``obj``.
+    """
+    overrides = overrides or {}
+    keys = []
+    exprs = []
+    for f in fields(cls):
+        attr = f"obj.{f.name}"
+        if f.name in overrides:
+            expr = overrides[f.name]
+            if expr is None:
+                continue
+        elif f.type is str or (isinstance(f.type, type) and issubclass(f.type, str)):
+            expr = f"_enc({attr})"
+        elif f.type is datetime:
+            expr = f"_enc({attr}.isoformat())"
+        elif f.type == Optional[datetime]:
+            expr = f"(_enc({attr}.isoformat()) if {attr} is not None else 'null')"
+        else:
+            expr = f"_dumps({attr})"
+        keys.append(f.name)
+        exprs.append(expr)
+    for key, expr in (extras or {}).items():
+        keys.append(key)
+        exprs.append(expr)
+
+    template = "{" + ",".join(f'"{key}":%s' for key in keys) + "}"
+    source = (
+        f"def {func_name}(obj):\n"
+        f"    return {template!r} % ({', '.join(exprs)},)\n"
+    )
+    namespace = {
+        "_enc": encode_basestring_ascii,
+        "_dumps": _json_dumps,
+        "locations_to_dicts": locations_to_dicts,
+    }
+    exec(source, namespace)
+    return namespace[func_name]
+
+# JSON counterparts of case_to_dict / evidence_to_dict
+case_to_json = _compile_json_serializer(
+    Case,
+    "case_to_json",
+    overrides={"evidence": None, "locations": None},
+    extras={
+        "evidence_count": "len(obj.evidence)",
+        "locations_count": "len(obj.locations)",
+    },
+)
+
+evidence_to_json = _compile_json_serializer(
+    Evidence,
+    "evidence_to_json",
+    overrides={"locations": "_dumps(locations_to_dicts(obj.locations))"},
+)
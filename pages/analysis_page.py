@@ -4,18 +4,22 @@ import struct
 import uuid
 import codecs
 import hashlib
-import re
 import time
 import json
+import bisect
+import stat
+import functools
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QMessageBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QLineEdit, QComboBox, QGroupBox, QGridLayout,
     QStatusBar, QProgressBar, QFileDialog, QAction, QMenu, QApplication, QTabWidget, QTextEdit,
-    QScrollArea, QListWidget, QListWidgetItem
+    QScrollArea, QTableView, QListView, QAbstractItemView
+)
+from PyQt5.QtGui import QFont, QColor, QKeySequence, QTextCursor
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QThread, pyqtSignal as Signal, QUrl, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QTimer, QObject, QRunnable, QThreadPool, QAbstractListModel
 )
-from PyQt5.QtGui import QFont, QColor, QKeySequence
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, pyqtSignal as Signal, QUrl
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 from services.registry_analyzer import RegistryAnalyzer
 # Third-party imports for SRUM
 try:
@@ -30,14 +34,21 @@ from .base_page import BasePage, COLOR_ORANGE, COLOR_DARK, COLOR_GRAY, TAB_NAMES
 from services.web_artifact_extractor import extract_all_web_artifacts
 from services.usb_analyzer import get_usb_devices
 from datetime import datetime, timedelta
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-class WebArtifactThread(QThread):
-    """Worker thread for extracting web artifacts."""
-    finished = Signal(dict)
+class WorkerSignals(QObject):
+    """Signals for pooled workers; the page holds each worker until it finishes so these outlive the run."""
+    finished = Signal(object)
 
-    def __init__(self, params, parent=None):
-        super().__init__(parent)
+class WebArtifactWorker(QRunnable):
+    """Pooled worker for extracting web artifacts."""
+
+    def __init__(self, params):
+        super().__init__()
         self.params = params
+        self.signals = WorkerSignals()
 
     def run(self):
         """Execute the extraction script."""
@@ -47,21 +58,434 @@ class WebArtifactThread(QThread):
             username=self.params.get('remote_user'),
             password=self.params.get('remote_password')
         )
-        self.finished.emit(result)
+        self.signals.finished.emit(result)
 
-class UsbDeviceThread(QThread):
-    """Worker thread for scanning local USB device history."""
-    finished = Signal(list)
+class UsbDeviceWorker(QRunnable):
+    """Pooled worker for scanning local USB device history."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = WorkerSignals()
 
     def run(self):
-        """Execute the USB device scan."""
+        """Execute the USB device scan and index the results for filtering."""
         devices = get_usb_devices()
-        self.finished.emit(devices)
+        # Lowercase every searchable value once so filtering is one substring test per row
+        for device in devices:
+            device["_search_blob"] = " ".join(
+                str(value) for key, value in device.items() if key != "datetime_obj"
+            ).lower()
+            if device.get("datetime_obj") is None:
+                device["datetime_obj"] = datetime.min  # Sorts first and fails every cutoff
+        # Time order lets the proxy find the cutoff row by bisection
+        devices.sort(key=itemgetter("datetime_obj"))
+        self.signals.finished.emit(devices)
+
+# Upper-cased file names of registry hives, as RawCopy writes them; transaction logs add a suffix
+REGISTRY_HIVE_NAMES = frozenset({
+    "SYSTEM", "SOFTWARE", "SAM", "SECURITY", "DEFAULT", "COMPONENTS", "DRIVERS", "BCD", "CLASSES",
+    "NTUSER.DAT", "USRCLASS.DAT", "AMCACHE.HVE",
+})
+REGISTRY_LOG_SUFFIXES = (".LOG", ".LOG1", ".LOG2")
+
+def is_hive_file_name(name):
+    """Return whether a file name is a known registry hive or one of its transaction logs."""
+    name = name.upper()
+    if name in REGISTRY_HIVE_NAMES:
+        return True
+    base, dot, suffix = name.rpartition(".")
+    return dot != "" and "." + suffix in REGISTRY_LOG_SUFFIXES and (
+        base in REGISTRY_HIVE_NAMES or base + ".DAT" in REGISTRY_HIVE_NAMES
+    )
+
+class HiveDirScanSignals(WorkerSignals):
+    """Signals for HiveDirScanWorker, which streams names in batches."""
+    started = Signal()
+    validated = Signal()
+    batch = Signal(object)
+
+class HiveDirScanWorker(QRunnable):
+    """Pooled worker for validating and listing a hive directory."""
+
+    def __init__(self, input_dir, cached=None):
+        super().__init__()
+        self.input_dir = input_dir
+        self.cached = cached  # (st_mtime_ns, names) from an earlier scan of this path, if any
+        self.signals = HiveDirScanSignals()
+
+    def run(self):
+        """Emit name batches, then (names, error, st_mtime_ns); st_mtime_ns is None for an unusable directory."""
+        self.signals.started.emit()
+        # Even the stat runs here: a disconnected network drive can block it for a long time
+        try:
+            dir_stat = os.stat(self.input_dir)
+        except (OSError, ValueError) as e:
+            self.signals.finished.emit(([], e, None))
+            return
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            self.signals.finished.emit(([], NotADirectoryError(self.input_dir), None))
+            return
+        self.signals.validated.emit()
+        mtime_ns = dir_stat.st_mtime_ns
+
+        # Adding or removing a file bumps the directory mtime, so a match means the listing is current
+        if self.cached is not None and self.cached[0] == mtime_ns:
+            names = self.cached[1]
+            self._emit_in_batches(names)
+            self.signals.finished.emit((names, None, mtime_ns))
+            return
+
+        names = []
+        batch = []
+        others = []
+        try:
+            # DirEntry carries the file type, so no entry costs a stat
+            with os.scandir(self.input_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if not is_hive_file_name(entry.name):
+                            others.append(entry.name)
+                            continue
+                        batch.append(entry.name)
+                        if len(batch) == HIVE_SCAN_BATCH_SIZE:
+                            self.signals.batch.emit(batch)
+                            names.extend(batch)
+                            batch = []
+        except Exception as e:
+            self.signals.finished.emit((names, e, mtime_ns))
+            return
+        if batch:
+            self.signals.batch.emit(batch)
+            names.extend(batch)
+        if not names:
+            self._emit_in_batches(others)
+            names = others
+        self.signals.finished.emit((names, None, mtime_ns))
+
+    def _emit_in_batches(self, names):
+        for start in range(0, len(names), HIVE_SCAN_BATCH_SIZE):
+            self.signals.batch.emit(names[start:start + HIVE_SCAN_BATCH_SIZE])
+
+USB_TABLE_HEADERS = ("Forensic ID", "Description", "Hardware ID", "Plug-in Time", "Duration", "Manufacturer")
+USB_COLUMN_WIDTHS = (260, 260, 220, 170, 110, 180)
+USB_TIME_FILTERS = {
+    "All Time": None,
+    "Last 7 Days": timedelta(days=7),
+    "Last 30 Days": timedelta(days=30),
+    "Last 90 Days": timedelta(days=90),
+    "Last Year": timedelta(days=365),
+}
+USB_CSV_BUFFER_SIZE = 1 << 20
+USB_CSV_CHUNK_ROWS = 1000
+SRUM_RESIZE_SAMPLE_ROWS = 50
+HIVE_SCAN_CACHE_SIZE = 16  # Directory listings kept, keyed by (path, mtime)
+HIVE_SCAN_BATCH_SIZE = 1024  # Names per list insert while a directory scan streams in
+HIVE_DIR_TIMEOUT_MS = 2000  # A hive directory that cannot be stat'ed this fast is reported unreachable
+REGISTRY_PROGRESS_MAX_LINES = 5000  # Oldest registry log lines are dropped past this
+REGISTRY_OPERATION_QUEUE_SIZE = 8  # Registry operations that may wait behind the running one
+
+# Fonts are shared; building a QFont per widget or cell costs a font database lookup each time
+FONT_SMALL = QFont("Segoe UI", 9)
+FONT_INFO = QFont("Segoe UI", 10)
+FONT_PLACEHOLDER = QFont("Segoe UI", 16)
+FONT_ARTIFACT_BUTTON = QFont("Segoe UI", 14, QFont.Weight.Bold)
+FONT_MEMORY_TAB = QFont("Segoe UI", 12, QFont.Weight.Bold)
+FONT_SUB_OPTION_BUTTON = QFont("Segoe UI", 10, QFont.Weight.Bold)
+FONT_MONO = QFont("Consolas", 10)
+FONT_MONO_CELL = QFont("Consolas", 9)
+FONT_PANEL_TITLE = QFont("Cascadia Mono", 16, QFont.Weight.Bold)
+FONT_PROGRESS_TITLE = QFont("Cascadia Mono", 18, QFont.Weight.Bold)
+FONT_GROUP = QFont("Cascadia Mono", 12, QFont.Weight.Bold)
+
+# Stylesheets are built once at import; Qt parses each distinct string once
+ARTIFACT_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {COLOR_DARK};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 12px;
+        text-align: center;
+    }}
+    QPushButton:hover {{
+        background-color: {COLOR_ORANGE};
+    }}
+"""
+SUB_OPTION_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {COLOR_DARK}; color: white; border: none;
+        border-radius: 8px; padding: 12px; text-align: center;
+    }}
+    QPushButton:hover {{ background-color: #555; }}
+    QPushButton:checked {{ background-color: {COLOR_ORANGE}; }}
+"""
+MEMORY_TAB_QSS = {
+    is_active: f"background-color: {COLOR_ORANGE if is_active else COLOR_DARK}; color: white; border-radius: 8px; padding: 10px;"
+    for is_active in (False, True)
+}
+USB_CONTAINER_QSS = """
+    QWidget {
+        font-family: 'Segoe UI';
+        font-size: 9pt;
+    }
+    QGroupBox {
+        border: 1px solid #ccc;
+        border-radius: 6px;
+        margin-top: 10px;
+        font-weight: bold;
+        background-color: #f7f7f7;
+        font-family: 'Segoe UI';
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 5px;
+        font-family: 'Segoe UI';
+    }
+    QPushButton#exportButton { 
+        background-color: #17a2b8; 
+        font-family: 'Segoe UI';
+    }
+    QPushButton#exportButton:hover { background-color: #138496; }
+    QPushButton#forensicButton { 
+        background-color: #dc3545; 
+        font-family: 'Segoe UI';
+    }
+    QPushButton#forensicButton:hover { background-color: #c82333; }
+    QProgressBar {
+        font-family: 'Segoe UI';
+    }
+"""
+REGISTRY_GROUP_BOX_QSS = f"""
+    QGroupBox {{
+        border: 2px solid {COLOR_DARK};
+        border-radius: 8px;
+        margin-top: 15px;
+        padding: 15px;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: {COLOR_DARK};
+        font-size: 14px;
+        font-weight: bold;
+    }}
+"""
+REGISTRY_HIVE_LIST_QSS = f"""
+#registryHiveList {{
+    border: 1px solid {COLOR_DARK};
+    border-radius: 5px;
+    padding: 5px;
+}}
+"""
+USB_HEADER_QSS = f"""
+    QHeaderView::section {{
+        background-color: {COLOR_DARK};
+        color: white;
+        padding: 6px;
+        font-weight: bold;
+        font-family: 'Segoe UI';
+    }}
+"""
+
+class CsvExportThread(QThread):
+    """Worker thread for writing row tuples to a CSV file under a header."""
+    finished = Signal(str, str)  # path, error message ("" on success)
+    progress = Signal(int)  # rows written so far
+
+    def __init__(self, path, rows, header, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.rows = rows
+        self.header = header
+
+    def run(self):
+        """Write the header and all rows, reporting any failure."""
+        try:
+            # 1 MiB buffer keeps large exports from issuing a write per row
+            with open(self.path, 'w', newline='', encoding='utf-8', buffering=USB_CSV_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.header)
+                rows = self.rows
+                # Flush and report progress per chunk
+                for start in range(0, len(rows), USB_CSV_CHUNK_ROWS):
+                    chunk = rows[start:start + USB_CSV_CHUNK_ROWS]
+                    writer.writerows(chunk)
+                    csvfile.flush()
+                    self.progress.emit(start + len(chunk))
+        except Exception as e:
+            self.finished.emit(self.path, str(e))
+            return
+        self.finished.emit(self.path, "")
+
+class UsbTableModel(QAbstractTableModel):
+    """Table model that serves USB device dicts to the view without per-cell items."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._cells = []
+        self._times = []
+        self._connected = []
+        self._connected_total = 0
+
+    def set_devices(self, devices):
+        """Replace the backing list of device dicts, which must be sorted by datetime_obj."""
+        self.beginResetModel()
+        self._rows = devices
+        # Display text for the fixed columns, built once; paints and sort compares just index it
+        self._cells = [tuple(str(device.get(key, "")) for key in USB_TABLE_HEADERS) for device in devices]
+        self._times = [device["datetime_obj"] for device in devices]
+        self._connected = [device.get("Connected") == "Yes" for device in devices]
+        self._connected_total = sum(self._connected)
+        self.endResetModel()
+
+    def device(self, row):
+        """Return the device dict shown at a source row."""
+        return self._rows[row]
+
+    def cells(self, row):
+        """Return the display strings of a source row, one per USB_TABLE_HEADERS column."""
+        return self._cells[row]
+
+    def connected_total(self):
+        """Return how many devices in the model are currently connected."""
+        return self._connected_total
+
+    def is_connected(self, row):
+        """Return whether the device at a source row is currently connected."""
+        return self._connected[row]
+
+    def first_row_since(self, cutoff):
+        """Return the first source row plugged in at or after cutoff."""
+        return bisect.bisect_left(self._times, cutoff)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(USB_TABLE_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._cells[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return USB_TABLE_HEADERS[section]
+        return None
+
+class UsbFilterProxyModel(QSortFilterProxyModel):
+    """Sorts the USB table and filters rows by search text and plug-in cutoff."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tokens = ()
+        self._cutoff = None
+        self._first_row = 0
+        self._connected = 0
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self._start_filter_pass)
+
+    def _start_filter_pass(self):
+        self._first_row = None
+        self._connected = 0
+
+    def connected_count(self):
+        """Number of accepted rows whose device is connected, tallied during the last filter pass."""
+        if not self._is_filtering():
+            return self.sourceModel().connected_total()
+        self.rowCount()  # Qt filters lazily; this runs the pass if nothing has asked for rows yet
+        return self._connected
+
+    def set_search(self, text):
+        """Filter to devices whose fields contain every word of text (case-insensitive)."""
+        # Split once here, not per row; each word may match a different field
+        tokens = tuple(text.lower().split())
+        if tokens != self._tokens:
+            self._tokens = tokens
+            self._connected = 0
+            self.invalidateFilter()
+
+    def set_cutoff(self, cutoff):
+        """Filter to devices plugged in at or after cutoff; None disables."""
+        if cutoff != self._cutoff:
+            self._cutoff = cutoff
+            self._start_filter_pass()
+            self.invalidateFilter()
+
+    def _is_filtering(self):
+        return bool(self._tokens) or self._cutoff is not None
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._is_filtering():
+            return True  # Nothing to test; connected_count() falls back to the model total
+        model = self.sourceModel()
+        # Rows are time-sorted, so the cutoff is one bisect per filter pass, not a compare per row
+        if self._first_row is None:
+            self._first_row = model.first_row_since(self._cutoff) if self._cutoff else 0
+        if source_row < self._first_row:
+            return False
+        tokens = self._tokens
+        if tokens:
+            blob = model.device(source_row)["_search_blob"]
+            if not all(token in blob for token in tokens):
+                return False
+        # Every source row is checked once per pass, so the connected tally comes for free
+        self._connected += model.is_connected(source_row)
+        return True
+
+class HiveListModel(QAbstractListModel):
+    """List model over plain hive file names, appended to as a directory scan streams in."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+
+    def clear(self):
+        self.beginResetModel()
+        self._names = []
+        self.endResetModel()
+
+    def append(self, names):
+        """Append a batch of names as one row insertion."""
+        if not names:
+            return
+        first = len(self._names)
+        self.beginInsertRows(QModelIndex(), first, first + len(names) - 1)
+        self._names.extend(names)
+        self.endInsertRows()
+
+    def name(self, row):
+        """Return the file name shown at a row."""
+        return self._names[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._names[index.row()]
+        return None
 
 # --- SRUM Analyzer Logic ---
 # Note: This large class is included here to avoid file creation issues.
 # It is recommended to move this to its own file in `services/`.
 
+# Tables decoded concurrently, each on its own ESE file handle
+SRUM_TABLE_WORKERS = min(8, os.cpu_count() or 1)
+SRUM_LOOKAHEAD_CELLS = 2_000_000  # Estimated cells (records x columns) decoded ahead of the consumer
+
+def _struct_decoder(fmt):
+    """Return a decoder for a column holding exactly one value packed as fmt."""
+    unpack = struct.Struct(fmt).unpack
+    return lambda data: unpack(data)[0]
+
 if SRUM_IMPORTS_AVAILABLE:
     class SrumAnalyzer:
         """
@@ -69,6 +493,23 @@ if SRUM_IMPORTS_AVAILABLE:
         This implementation is based on the more comprehensive reference script.
         """
 
+        # ESE column type -> decoder for the raw value bytes; ESE stores numbers little-endian
+        _COLUMN_DECODERS = {
+            pyesedb.column_types.BINARY_DATA: lambda data: data.hex(),
+            pyesedb.column_types.BOOLEAN: _struct_decoder("<?"),
+            pyesedb.column_types.DOUBLE_64BIT: _struct_decoder("<d"),
+            pyesedb.column_types.FLOAT_32BIT: _struct_decoder("<f"),
+            pyesedb.column_types.GUID: lambda data: str(uuid.UUID(bytes=data)),
+            pyesedb.column_types.INTEGER_16BIT_SIGNED: _struct_decoder("<h"),
+            pyesedb.column_types.INTEGER_16BIT_UNSIGNED: _struct_decoder("<H"),
+            pyesedb.column_types.INTEGER_32BIT_SIGNED: _struct_decoder("<i"),
+            pyesedb.column_types.INTEGER_32BIT_UNSIGNED: _struct_decoder("<I"),
+            pyesedb.column_types.INTEGER_64BIT_SIGNED: _struct_decoder("<q"),
+            pyesedb.column_types.INTEGER_8BIT_UNSIGNED: _struct_decoder("<B"),
+            pyesedb.column_types.LARGE_BINARY_DATA: lambda data: data.hex(),
+            pyesedb.column_types.SUPER_LARGE_VALUE: lambda data: data.hex(),
+        }
+
         def __init__(self, srum_path, template_path, reg_hive_path=None):
             self.srum_path = srum_path
             self.template_path = template_path
@@ -78,9 +519,11 @@ if SRUM_IMPORTS_AVAILABLE:
             self.id_table = {}
             self.interface_table = {}
             self.regsids = {}
+            self._decoders = dict(self._COLUMN_DECODERS)
+            self._decoders[pyesedb.column_types.DATE_TIME] = self._ole_timestamp
 
         def analyze(self):
-            """Main method to run the analysis."""
+            """Yield (table name, rows) per table; rows[0] is the header."""
             if self.reg_hive_path:
                 self.interface_table = self._load_interfaces(self.reg_hive_path)
                 self.regsids = self._load_registry_sids(self.reg_hive_path)
@@ -102,61 +545,81 @@ if SRUM_IMPORTS_AVAILABLE:
             if self.regsids:
                 self.template_lookups.setdefault("Known SIDS", {}).update(self.regsids)
             
-            self.id_table = self._load_srumid_lookups(ese_db)
-
-            skip_tables = ['MSysObjects', 'MSysObjectsShadow', 'MSysObjids', 'MSysLocales', 'SruDbIdMapTable']
-            all_tables_data, message = self._process_srum_tables(ese_db, skip_tables)
+            try:
+                self.id_table = self._load_srumid_lookups(ese_db)
 
-            ese_db.close()
-            return all_tables_data, message
+                skip_tables = ['MSysObjects', 'MSysObjectsShadow', 'MSysObjids', 'MSysLocales', 'SruDbIdMapTable']
+                yield from self._iter_srum_tables(ese_db, skip_tables)
+            finally:
+                ese_db.close()
 
-        def _process_srum_tables(self, ese_db, skip_tables):
-            all_tables_data = {}
+        def _iter_srum_tables(self, ese_db, skip_tables):
+            tables = []
             for table_num in range(ese_db.number_of_tables):
                 ese_table = ese_db.get_table(table_num)
-                if ese_table.name in skip_tables:
-                    continue
-
-                tname = self._ese_table_guid_to_name(ese_table)
-                num_recs = self._ese_table_record_count(ese_table)
-                if not num_recs:
-                    continue
+                if ese_table.name not in skip_tables:
+                    tables.append((table_num, self._ese_table_record_count(ese_table) * ese_table.number_of_columns))
+            # Yielded in file order; decoding ahead is capped at SRUM_LOOKAHEAD_CELLS or one oversized table
+            pending = deque()
+            pending_cells = 0
+            executor = ThreadPoolExecutor(max_workers=SRUM_TABLE_WORKERS)
+            try:
+                for table_num, cells in tables:
+                    while len(pending) >= SRUM_TABLE_WORKERS or (pending and pending_cells + cells > SRUM_LOOKAHEAD_CELLS):
+                        future, done_cells = pending.popleft()
+                        pending_cells -= done_cells
+                        result = future.result()
+                        if result: yield result
+                    pending.append((executor.submit(self._process_table_at, table_num), cells))
+                    pending_cells += cells
+                while pending:
+                    result = pending.popleft()[0].result()
+                    if result: yield result
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        def _process_table_at(self, table_num):
+            # libesedb handles are not documented as thread-safe, so each worker opens its own
+            ese_db = pyesedb.file()
+            ese_db.open(self.srum_path)
+            try:
+                return self._process_one_table(ese_db.get_table(table_num))
+            finally:
+                ese_db.close()
 
-                table_data = []
-                column_names = [x.name for x in ese_table.columns]
+        def _process_one_table(self, ese_table):
+            """Decode one ESE table into (display name, rows), or None when it has no records."""
+            num_recs = self._ese_table_record_count(ese_table)
+            if not num_recs:
+                return None
+
+            tname = self._ese_table_guid_to_name(ese_table)
+            # Read the column schema once per table
+            columns = list(ese_table.columns)
+            column_names = [x.name for x in columns]
+            col_decoders = [self._decoders.get(x.type, self._blob_to_string) for x in columns]
+            # Untemplated tables get an empty field map
+            _, tfields = self.template_tables.get(ese_table.name, (None, {}))
+            # A templated table shows only its template's columns, so the rest are never decoded
+            wanted_cols = [i for i, name in enumerate(column_names) if name in tfields] or range(len(columns))
+            formatters = self._compile_formatters(tfields)
+            wanted = [(i, col_decoders[i], formatters.get(column_names[i])) for i in wanted_cols]
+
+            header_row = [tfields[column_names[i]][2] if column_names[i] in tfields else column_names[i] for i in wanted_cols]
+            table_data = [header_row]
+
+            for row_num in range(num_recs):
+                ese_row = self._ese_table_get_record(ese_table, row_num)
+                if ese_row is None: continue
                 
-                header_row = []
-                if ese_table.name in self.template_tables:
-                    _, tfields = self.template_tables.get(ese_table.name)
-                    for eachcol in ese_table.columns:
-                        if eachcol.name in tfields:
-                            _, _, cell_value = tfields.get(eachcol.name)
-                            header_row.append(cell_value)
-                        else:
-                            header_row.append(eachcol.name)
-                else:
-                    header_row = [x.name for x in ese_table.columns]
-                table_data.append(header_row)
-
-                for row_num in range(num_recs):
-                    ese_row = self._ese_table_get_record(ese_table, row_num)
-                    if ese_row is None: continue
-                    
-                    gui_row = []
-                    for col_num in range(ese_table.number_of_columns):
-                        val = self._smart_retrieve(ese_table, row_num, col_num)
-                        if val == "Error": val = f"WARNING: Invalid Column Name {column_names[col_num]}"
-                        elif val is None: val = "None"
-                        elif ese_table.name in self.template_tables:
-                            _, tfields = self.template_tables.get(ese_table.name)
-                            if column_names[col_num] in tfields:
-                                _, cformat, _ = tfields.get(column_names[col_num])
-                                val = self._format_output_for_gui(val, cformat)
-                        gui_row.append(str(val))
-                    table_data.append(gui_row)
-
-                all_tables_data[tname] = table_data
-            return all_tables_data, "Finished processing all tables."
+                gui_row = []
+                # Every column is decoded from the record fetched above, not re-fetched per cell
+                for col_num, decode, format_cell in wanted:
+                    val = self._decode_data(decode, ese_row.get_value_data(col_num))
+                    gui_row.append("None" if val is None else format_cell(val) if format_cell else str(val))
+                table_data.append(gui_row)
+
+            return tname, table_data
         
         def _load_registry_sids(self, reg_file):
             sids = {}
@@ -196,12 +659,15 @@ if SRUM_IMPORTS_AVAILABLE:
                 lookup_table = database.get_table_by_name('SruDbIdMapTable')
                 column_lookup = {x.name: i for i, x in enumerate(lookup_table.columns)}
             except (IOError, AttributeError): return {}
+            blob_col, type_col, index_col = column_lookup['IdBlob'], column_lookup['IdType'], column_lookup['IdIndex']
+            # One fetch per record; all three columns are read from it
             for rec_num in range(self._ese_table_record_count(lookup_table)):
-                blob = self._smart_retrieve(lookup_table, rec_num, column_lookup['IdBlob'])
-                id_type = self._smart_retrieve(lookup_table, rec_num, column_lookup['IdType'])
-                if id_type == 3: blob = self._binary_sid_to_string_sid(blob)
-                elif blob not in ["Empty", "Error"]: blob = self._blob_to_string(blob)
-                id_lookup[self._smart_retrieve(lookup_table, rec_num, column_lookup['IdIndex'])] = blob
+                rec = self._ese_table_get_record(lookup_table, rec_num)
+                if not rec: continue
+                blob = self._decode_value(rec, blob_col)
+                if self._decode_value(rec, type_col) == 3: blob = self._binary_sid_to_string_sid(blob)
+                elif blob != "Empty": blob = self._blob_to_string(blob)
+                id_lookup[self._decode_value(rec, index_col)] = blob
             return id_lookup
 
         def _load_template_lookups(self, wb):
@@ -242,77 +708,71 @@ if SRUM_IMPORTS_AVAILABLE:
                 tables[ese_table] = (name, fields)
             return tables
 
-        def _smart_retrieve(self, ese_table, ese_record_num, column_number):
-            rec = self._ese_table_get_record(ese_table, ese_record_num)
-            if not rec: return "Error"
-            
-            col_type = rec.get_column_type(column_number)
-            col_data = rec.get_value_data(column_number)
-            
-            if col_data is None: return "Empty"
+        def _decode_value(self, rec, column_number):
+            """Decode one column of an already fetched record."""
+            # Text, OLE dates and unlisted types fall through to _blob_to_string
+            decode = self._decoders.get(rec.get_column_type(column_number), self._blob_to_string)
+            return self._decode_data(decode, rec.get_value_data(column_number))
 
+        def _decode_data(self, decode, col_data):
+            """Decode raw column bytes with the decoder chosen for the column's type."""
+            if col_data is None: return "Empty"
             try:
-                if col_type == pyesedb.column_types.BINARY_DATA: return codecs.encode(col_data,"HEX").decode()
-                elif col_type == pyesedb.column_types.BOOLEAN: return struct.unpack('?',col_data)[0]
-                elif col_type == pyesedb.column_types.DATE_TIME: return self._ole_timestamp(col_data)
-                elif col_type == pyesedb.column_types.DOUBLE_64BIT: return struct.unpack('d',col_data)[0]
-                elif col_type == pyesedb.column_types.FLOAT_32BIT: return struct.unpack('f',col_data)[0]
-                elif col_type == pyesedb.column_types.GUID: return str(uuid.UUID(bytes=col_data))
-                elif col_type == pyesedb.column_types.INTEGER_16BIT_SIGNED: return struct.unpack('h',col_data)[0]
-                elif col_type == pyesedb.column_types.INTEGER_16BIT_UNSIGNED: return struct.unpack('H',col_data)[0]
-                elif col_type == pyesedb.column_types.INTEGER_32BIT_SIGNED: return struct.unpack('i',col_data)[0]
-                elif col_type == pyesedb.column_types.INTEGER_32BIT_UNSIGNED: return struct.unpack('I',col_data)[0]
-                elif col_type == pyesedb.column_types.INTEGER_64BIT_SIGNED: return struct.unpack('q',col_data)[0]
-                elif col_type == pyesedb.column_types.INTEGER_8BIT_UNSIGNED: return struct.unpack('B',col_data)[0]
-                elif col_type == pyesedb.column_types.LARGE_BINARY_DATA: return codecs.encode(col_data,"HEX").decode()
-                elif col_type == pyesedb.column_types.LARGE_TEXT: return self._blob_to_string(col_data)
-                elif col_type == pyesedb.column_types.SUPER_LARGE_VALUE: return codecs.encode(col_data,"HEX").decode()
-                elif col_type == pyesedb.column_types.TEXT: return self._blob_to_string(col_data)
+                return decode(col_data)
             except (struct.error, TypeError):
                 return self._blob_to_string(col_data) # Fallback on error
-            
-            return self._blob_to_string(col_data)
 
-        def _format_output_for_gui(self, val, fmt):
-            if val is None: return "None"
-            if fmt is None: return str(val)
-            
+        def _compile_formatters(self, tfields):
+            """Map each templated column name to its cell formatter."""
+            return {name: self._compile_formatter(cformat) for name, (_, cformat, _) in tfields.items()}
+
+        def _compile_formatter(self, fmt):
+            """Return a callable formatting one decoded value for a template format."""
+            if fmt is None: return str
+
             fmt_lower = fmt.lower()
-            try:
-                if fmt_lower.startswith("ole"):
-                    if isinstance(val, datetime): val = val.strftime(fmt[4:] if ":" in fmt else '%Y-%m-%d %H:%M:%S')
-                elif fmt_lower.startswith("file"):
+            convert = None
+            if fmt_lower.startswith("ole"):
+                time_fmt = fmt[4:] if ":" in fmt else '%Y-%m-%d %H:%M:%S'
+                convert = lambda val: val.strftime(time_fmt) if isinstance(val, datetime) else val
+            elif fmt_lower.startswith("file"):
+                time_fmt = fmt[5:] if ":" in fmt else '%Y-%m-%d %H:%M:%S'
+                def convert(val):
                     ft = self._file_timestamp(val)
-                    if isinstance(ft, datetime): val = ft.strftime(fmt[5:] if ":" in fmt else '%Y-%m-%d %H:%M:%S')
-                    else: val = ft
-                elif fmt_lower.startswith("lookup-"):
-                    lookup_name = fmt.split("-")[1]
-                    val = self.template_lookups.get(lookup_name, {}).get(val, val)
-                elif fmt_lower == "lookup_id": val = self.id_table.get(val, f"Unknown ID ({val})")
-                elif fmt_lower == "lookup_luid":
-                    inttype = struct.unpack(">H6B", codecs.decode(format(val,'016x'),'hex'))[0]
-                    val = self.template_lookups.get("LUID Interfaces",{}).get(inttype,"")
-                elif fmt_lower == "seconds": val = str(timedelta(seconds=val or 0))
-                elif fmt_lower == "md5": val = hashlib.md5(str(val).encode()).hexdigest()
-                elif fmt_lower == "sha1": val = hashlib.sha1(str(val).encode()).hexdigest()
-                elif fmt_lower == "sha256": val = hashlib.sha256(str(val).encode()).hexdigest()
-                elif fmt_lower == "base16": val = hex(val) if isinstance(val, int) else format(val,"08x")
-                elif fmt_lower == "base2": val = format(val,"032b") if isinstance(val, int) else int(str(val),2)
-                elif fmt_lower == "interface_id" and self.reg_hive_path: val = self.interface_table.get(str(val),"")
-            except Exception: pass
-            return str(val)
+                    return ft.strftime(time_fmt) if isinstance(ft, datetime) else ft
+            elif fmt_lower.startswith("lookup-"):
+                lookup = self.template_lookups.get(fmt.split("-")[1], {})
+                convert = lambda val: lookup.get(val, val)
+            elif fmt_lower == "lookup_id":
+                id_table = self.id_table
+                convert = lambda val: id_table.get(val, f"Unknown ID ({val})")
+            elif fmt_lower == "lookup_luid":
+                luid_lookup = self.template_lookups.get("LUID Interfaces", {})
+                convert = lambda val: luid_lookup.get(struct.unpack(">H6B", codecs.decode(format(val,'016x'),'hex'))[0], "")
+            elif fmt_lower == "seconds": convert = lambda val: str(timedelta(seconds=val or 0))
+            elif fmt_lower in ("md5", "sha1", "sha256"):
+                hasher = getattr(hashlib, fmt_lower)
+                convert = lambda val: hasher(str(val).encode()).hexdigest()
+            elif fmt_lower == "base16": convert = lambda val: hex(val) if isinstance(val, int) else format(val,"08x")
+            elif fmt_lower == "base2": convert = lambda val: format(val,"032b") if isinstance(val, int) else int(str(val),2)
+            elif fmt_lower == "interface_id" and self.reg_hive_path:
+                interface_table = self.interface_table
+                convert = lambda val: interface_table.get(str(val),"")
+            if convert is None: return str
+
+            def format_cell(val):
+                try: return str(convert(val))
+                except Exception: return str(val)
+            return format_cell
 
         def _binary_sid_to_string_sid(self, sid_hex):
             if not sid_hex: return ""
             try:
-                sid = codecs.decode(sid_hex, "hex")
-                sid_str = f"S-{sid[0]}"
-                sub_auth_count = sid[1]
+                sid = bytes.fromhex(sid_hex) if isinstance(sid_hex, str) else sid_hex
                 id_auth = struct.unpack(">Q", b'\x00\x00' + sid[2:8])[0]
-                sid_str += f"-{id_auth}"
-                for i in range(sub_auth_count):
-                    sub_auth = struct.unpack("<L", sid[8 + i*4 : 12 + i*4])[0]
-                    sid_str += f"-{sub_auth}"
+                # All sub-authorities in one unpack; a truncated SID raises struct.error
+                sub_auths = struct.unpack_from(f"<{sid[1]}I", sid, 8)
+                sid_str = "-".join(map(str, (f"S-{sid[0]}", id_auth) + sub_auths))
                 sid_name = self.template_lookups.get("Known SIDS", {}).get(sid_str, 'unknown')
                 return f"{sid_str} ({sid_name})"
             except Exception: return "Invalid SID"
@@ -322,9 +782,14 @@ if SRUM_IMPORTS_AVAILABLE:
                 if isinstance(blob, str): chrblob = codecs.decode(blob, "hex")
                 else: chrblob = blob
                 
-                if re.match(b'^(?:[^\x00]\x00)+\x00\x00$', chrblob): return chrblob.decode("utf-16-le").strip("\x00")
-                elif re.match(b'^(?:\x00[^\x00])+\x00\x00$', chrblob): return chrblob.decode("utf-16-be").strip("\x00")
-                else: return chrblob.decode("latin1").strip("\x00")
+                # Sniff NUL-terminated UTF-16 from the first code unit
+                n = len(chrblob)
+                if n >= 4 and not n % 2 and chrblob[-2:] == b"\x00\x00":
+                    encoding = "utf-16-le" if chrblob[0] and not chrblob[1] else "utf-16-be" if chrblob[1] and not chrblob[0] else None
+                    if encoding:
+                        try: return chrblob.decode(encoding).strip("\x00")
+                        except UnicodeDecodeError: pass
+                return chrblob.strip(b"\x00").decode("latin1")
             except Exception:
                 return codecs.encode(blob, 'hex').decode() if isinstance(blob, bytes) else str(blob)
 
@@ -354,6 +819,7 @@ if SRUM_IMPORTS_AVAILABLE:
 
     class SrumAnalysisThread(QThread):
         """Worker thread for running SRUM analysis."""
+        table_ready = Signal(str, list)  # Emitted per table as soon as it is decoded
         finished = Signal(dict)
 
         def __init__(self, params, parent=None):
@@ -368,8 +834,9 @@ if SRUM_IMPORTS_AVAILABLE:
                     template_path=self.params['template_path'],
                     reg_hive_path=self.params.get('reg_path')
                 )
-                data, message = analyzer.analyze()
-                self.finished.emit({"status": "success", "data": data, "message": message})
+                for tname, table_data in analyzer.analyze():
+                    self.table_ready.emit(tname, table_data)
+                self.finished.emit({"status": "success", "message": "Finished processing all tables."})
             except Exception as e:
                 self.finished.emit({"status": "error", "message": str(e)})
 
@@ -379,14 +846,35 @@ class AnalysisPage(BasePage):
     def __init__(self):
         super().__init__()
         self.connection_params = None
-        self.web_artifact_thread = None
-        self.usb_device_thread = None
-        self.registry_worker_thread = None
+        self.artifact_buttons = {}
+        self._artifact_workers = {}  # artifact name -> in-flight pooled worker
+        self.usb_export_thread = None
+        self.registry_worker = None
+        self._registry_op_queue = deque()  # (operation, kwargs) waiting for the running worker
+        self.hive_scan_worker = None
+        self._hive_scan_cache = {}  # abs path -> (st_mtime_ns, file names)
+        self._hive_scan_path = None
+        self._stale_hive_scans = set()
+        self._hive_dir_timer = QTimer(self)
+        self._hive_dir_timer.setSingleShot(True)
+        self._hive_dir_timer.setInterval(HIVE_DIR_TIMEOUT_MS)
+        self._hive_dir_timer.timeout.connect(self._on_hive_dir_timeout)
         self.registry_analyzer = RegistryAnalyzer()
         self.srum_analysis_thread = None
         self.usb_devices = [] # To store full list of devices
-        self.displayed_usb_devices = [] # To store the currently visible list
         self.selected_case_path = None  # Add missing attribute
+        # Coalesces bursts of search keystrokes into a single filter pass
+        self._usb_filter_timer = QTimer(self)
+        self._usb_filter_timer.setSingleShot(True)
+        self._usb_filter_timer.setInterval(150)
+        self._usb_filter_timer.timeout.connect(self.apply_usb_filters)
+        self._usb_cutoff = None
+        # Registry progress lines are buffered and appended at most every 50 ms
+        self._registry_progress_buffer = []
+        self._registry_progress_timer = QTimer(self)
+        self._registry_progress_timer.setSingleShot(True)
+        self._registry_progress_timer.setInterval(50)
+        self._registry_progress_timer.timeout.connect(self._flush_registry_progress)
         self.setup_page_content()
         self._select_tab_programmatically("Analyze Evidence")
         
@@ -413,12 +901,25 @@ class AnalysisPage(BasePage):
 
     def _switch_right_panel_view(self, view_to_show):
         """Manages visibility of widgets in the right panel."""
-        self.web_view.setVisible(self.web_view == view_to_show)
-        self.usb_view_container.setVisible(self.usb_view_container == view_to_show)
-        self.registry_view_container.setVisible(self.registry_view_container == view_to_show)
-        self.srum_tab_widget.setVisible(self.srum_tab_widget == view_to_show)
-        self.memory_view_container.setVisible(self.memory_view_container == view_to_show)
-        self.placeholder_label.setVisible(self.placeholder_label == view_to_show)
+        for view in (self.web_view, self.usb_view_container, self.registry_view_container,
+                     self.srum_tab_widget, self.memory_view_container, self.placeholder_label):
+            if view is not None:  # Lazily built views may not exist yet
+                view.setVisible(view == view_to_show)
+
+    def _ensure_web_view(self):
+        """Create the web view on first use; it starts a Chromium process."""
+        if self.web_view is None:
+            from PyQt5.QtWebEngineWidgets import QWebEngineView
+            self.web_view = QWebEngineView()
+            self.right_layout.insertWidget(0, self.web_view)
+        return self.web_view
+
+    def _ensure_registry_view(self):
+        """Build the registry view on first use; most sessions never open it."""
+        if self.registry_view_container is None:
+            self.registry_view_container = self.create_registry_view()
+            self.right_layout.insertWidget(self.right_layout.indexOf(self.usb_view_container) + 1, self.registry_view_container)
+        return self.registry_view_container
 
     def setup_page_content(self):
         """Setup the page-specific content for the analysis page"""
@@ -444,22 +945,11 @@ class AnalysisPage(BasePage):
         artifact_buttons = ["MEMORY", "WEB", "SRUM", "REGISTRY", "USB"]
         for artifact_name in artifact_buttons:
             button = QPushButton(artifact_name)
-            button.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLOR_DARK};
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 12px;
-                    text-align: center;
-                }}
-                QPushButton:hover {{
-                    background-color: {COLOR_ORANGE};
-                }}
-            """)
+            button.setFont(FONT_ARTIFACT_BUTTON)
+            button.setStyleSheet(ARTIFACT_BUTTON_QSS)
             button.clicked.connect(lambda ch, name=artifact_name: self.on_artifact_button_click(name))
             left_layout.addWidget(button)
+            self.artifact_buttons[artifact_name] = button
         
         content_layout.addWidget(left_panel)
 
@@ -469,10 +959,10 @@ class AnalysisPage(BasePage):
         
         right_layout = QVBoxLayout(self.right_panel)
         right_layout.setContentsMargins(2, 2, 2, 2)
+        self.right_layout = right_layout
 
-        # Web view for web artifacts
-        self.web_view = QWebEngineView()
-        right_layout.addWidget(self.web_view)
+        # Web view for web artifacts; created on first WEB request (see _ensure_web_view)
+        self.web_view = None
 
         # --- SRUM View Container ---
         self.srum_tab_widget = QTabWidget()
@@ -502,42 +992,13 @@ class AnalysisPage(BasePage):
         
         # --- USB View Container ---
         self.usb_view_container = QWidget()
-        self.usb_view_container.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                margin-top: 10px;
-                font-weight: bold;
-                background-color: #f7f7f7;
-                font-family: 'Segoe UI';
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-                font-family: 'Segoe UI';
-            }
-            QPushButton#exportButton { 
-                background-color: #17a2b8; 
-                font-family: 'Segoe UI';
-            }
-            QPushButton#exportButton:hover { background-color: #138496; }
-            QPushButton#forensicButton { 
-                background-color: #dc3545; 
-                font-family: 'Segoe UI';
-            }
-            QPushButton#forensicButton:hover { background-color: #c82333; }
-            QProgressBar {
-                font-family: 'Segoe UI';
-            }
-        """)
+        self.usb_view_container.setStyleSheet(USB_CONTAINER_QSS)
         usb_layout = QVBoxLayout(self.usb_view_container)
         usb_layout.setContentsMargins(0, 0, 0, 0)
         usb_layout.setSpacing(10)
 
         # Controls Panel
         control_panel = QGroupBox("Controls")
-        control_panel.setFont(QFont("Segoe UI", 9))
         control_layout = QGridLayout(control_panel)
         control_layout.setContentsMargins(15, 25, 15, 15)
         control_layout.setSpacing(10)
@@ -545,28 +1006,22 @@ class AnalysisPage(BasePage):
         self.usb_search_box = QLineEdit()
         self.usb_search_box.setPlaceholderText("Type to filter devices...")
         self.usb_search_box.setClearButtonEnabled(True)
-        self.usb_search_box.setFont(QFont("Segoe UI", 9))
-        self.usb_search_box.textChanged.connect(self.apply_usb_filters)
+        self.usb_search_box.textChanged.connect(self._usb_filter_timer.start)
 
         self.usb_time_filter = QComboBox()
-        self.usb_time_filter.addItems(["All Time", "Last 7 Days", "Last 30 Days", "Last 90 Days", "Last Year"])
-        self.usb_time_filter.setFont(QFont("Segoe UI", 9))
-        self.usb_time_filter.currentIndexChanged.connect(self.apply_usb_filters)
+        self.usb_time_filter.addItems(USB_TIME_FILTERS)
+        self.usb_time_filter.currentIndexChanged.connect(self._recompute_usb_cutoff)
         
         self.export_button = QPushButton("Export to CSV")
         self.export_button.setObjectName("exportButton")
-        self.export_button.setFont(QFont("Segoe UI", 9))
         self.export_button.clicked.connect(self.export_usb_csv)
         
         self.forensic_button = QPushButton("Forensic Analysis")
         self.forensic_button.setObjectName("forensicButton")
-        self.forensic_button.setFont(QFont("Segoe UI", 9))
         self.forensic_button.clicked.connect(self.perform_forensic_analysis)
 
         search_label = QLabel("Search:")
-        search_label.setFont(QFont("Segoe UI", 9))
         time_label = QLabel("Time Range:")
-        time_label.setFont(QFont("Segoe UI", 9))
         
         control_layout.addWidget(search_label, 0, 0)
         control_layout.addWidget(self.usb_search_box, 0, 1)
@@ -578,46 +1033,43 @@ class AnalysisPage(BasePage):
 
         usb_layout.addWidget(control_panel)
 
-        # USB Table
-        self.usb_table_view = QTableWidget()
+        # USB Table: the view only asks the model for visible cells; the proxy sorts
+        self.usb_table_model = UsbTableModel(self)
+        self.usb_proxy_model = UsbFilterProxyModel(self)
+        self.usb_proxy_model.setSourceModel(self.usb_table_model)
+        self.usb_table_view = QTableView()
+        self.usb_table_view.setModel(self.usb_proxy_model)
         self.usb_table_view.setSortingEnabled(True)
         self.usb_table_view.setAlternatingRowColors(True)
-        self.usb_table_view.setSelectionBehavior(QTableWidget.SelectRows)
-        self.usb_table_view.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.usb_table_view.setSelectionBehavior(QTableView.SelectRows)
+        self.usb_table_view.setEditTriggers(QTableView.NoEditTriggers)
         self.usb_table_view.verticalHeader().setVisible(False)
-        self.usb_table_view.horizontalHeader().setStretchLastSection(True)
+        self.usb_table_view.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        usb_header = self.usb_table_view.horizontalHeader()
+        usb_header.setStretchLastSection(True)
+        usb_header.setSectionResizeMode(QHeaderView.Interactive)
+        for col, width in enumerate(USB_COLUMN_WIDTHS):
+            usb_header.resizeSection(col, width)
         self.usb_table_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.usb_table_view.customContextMenuRequested.connect(self.show_usb_context_menu)
         self.usb_table_view.doubleClicked.connect(self.show_usb_device_details)
-        self.usb_table_view.setFont(QFont("Segoe UI", 9))
-        self.usb_table_view.horizontalHeader().setStyleSheet(f"""
-            QHeaderView::section {{
-                background-color: {COLOR_DARK};
-                color: white;
-                padding: 6px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-            }}
-        """)
+        self.usb_table_view.horizontalHeader().setStyleSheet(USB_HEADER_QSS)
         usb_layout.addWidget(self.usb_table_view, 1)
 
         # Status Bar
         self.usb_status_bar = QStatusBar()
         self.usb_status_bar.setSizeGripEnabled(False)
-        self.usb_status_bar.setFont(QFont("Segoe UI", 9))
         self.usb_device_count_label = QLabel()
-        self.usb_device_count_label.setFont(QFont("Segoe UI", 9))
         self.usb_status_bar.addPermanentWidget(self.usb_device_count_label)
         self.usb_progress_bar = QProgressBar()
         self.usb_progress_bar.setMaximumWidth(250)
         self.usb_progress_bar.setVisible(False)
-        self.usb_progress_bar.setFont(QFont("Segoe UI", 9))
         self.usb_status_bar.addPermanentWidget(self.usb_progress_bar)
         usb_layout.addWidget(self.usb_status_bar)
 
         right_layout.addWidget(self.usb_view_container)
-        self.registry_view_container = self.create_registry_view()
-        right_layout.addWidget(self.registry_view_container)
+        # Registry view is built on first REGISTRY click (see _ensure_registry_view)
+        self.registry_view_container = None
 
         # --- Memory Analysis View Container ---
         self.memory_view_container = QWidget()
@@ -626,7 +1078,7 @@ class AnalysisPage(BasePage):
 
         # Placeholder label for messages
         self.placeholder_label = QLabel("Select an artifact to view details")
-        self.placeholder_label.setFont(QFont("Segoe UI", 16))
+        self.placeholder_label.setFont(FONT_PLACEHOLDER)
         self.placeholder_label.setAlignment(Qt.AlignCenter)
         self.placeholder_label.setStyleSheet("color: #aaa;")
         right_layout.addWidget(self.placeholder_label)
@@ -649,7 +1101,7 @@ class AnalysisPage(BasePage):
         memory_tab_names = ["Core Analysis Files", "Volatility", "Memory Dumps"]
         for name in memory_tab_names:
             button = QPushButton(name)
-            button.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+            button.setFont(FONT_MEMORY_TAB)
             button.setCheckable(True)
             button.clicked.connect(self._on_memory_tab_click)
             tabs_layout.addWidget(button)
@@ -675,7 +1127,7 @@ class AnalysisPage(BasePage):
         right_panel_layout = QVBoxLayout(self.memory_right_panel)
         self.memory_results_view = QTextEdit()
         self.memory_results_view.setReadOnly(True)
-        self.memory_results_view.setFont(QFont("Consolas", 10))
+        self.memory_results_view.setFont(FONT_MONO)
         self.memory_results_view.setStyleSheet("border: none; background-color: white; padding: 5px;")
         right_panel_layout.addWidget(self.memory_results_view)
 
@@ -707,16 +1159,9 @@ class AnalysisPage(BasePage):
         buttons = []
         for name in button_names:
             button = QPushButton(name)
-            button.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+            button.setFont(FONT_SUB_OPTION_BUTTON)
             button.setCheckable(True)
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLOR_DARK}; color: white; border: none;
-                    border-radius: 8px; padding: 12px; text-align: center;
-                }}
-                QPushButton:hover {{ background-color: #555; }}
-                QPushButton:checked {{ background-color: {COLOR_ORANGE}; }}
-            """)
+            button.setStyleSheet(SUB_OPTION_BUTTON_QSS)
             button.clicked.connect(self._on_memory_sub_option_click)
             layout.addWidget(button)
             buttons.append(button)
@@ -733,7 +1178,7 @@ class AnalysisPage(BasePage):
             is_active = (button == sender)
             button.setChecked(is_active)
             self.memory_sub_option_panels[name].setVisible(is_active)
-            button.setStyleSheet(f"background-color: {COLOR_ORANGE if is_active else COLOR_DARK}; color: white; border-radius: 8px; padding: 10px;")
+            button.setStyleSheet(MEMORY_TAB_QSS[is_active])
         
         self.memory_results_view.clear()
         # Auto-click the first sub-option in the visible panel
@@ -1120,6 +1565,10 @@ class AnalysisPage(BasePage):
 
     def on_artifact_button_click(self, artifact_name):
         """Handle clicks on the artifact buttons."""
+        if artifact_name in self._artifact_workers:
+            self.placeholder_label.setText(f"{artifact_name} analysis is already running...")
+            return
+
         self._switch_right_panel_view(self.placeholder_label)
         self.placeholder_label.setText(f"Gathering data for {artifact_name}...")
 
@@ -1132,23 +1581,20 @@ class AnalysisPage(BasePage):
                 QMessageBox.warning(self, "Error", "Connection parameters not set for remote artifact extraction.")
                 self.placeholder_label.setText("Select an artifact to view details")
                 return
-            self.web_view.load(QUrl()) # Clear previous contentAdd commentMore actions
+            self._ensure_web_view().load(QUrl()) # Clear previous content
             self._switch_right_panel_view(self.web_view)
-            self.web_artifact_thread = WebArtifactThread(self.connection_params)
-            self.web_artifact_thread.finished.connect(self.on_web_extraction_finished)
-            self.web_artifact_thread.start()
+            self._start_artifact_worker("WEB", WebArtifactWorker(self.connection_params), self.on_web_extraction_finished)
         
         elif artifact_name == "USB":
-            self.usb_device_thread = UsbDeviceThread()
-            self.usb_device_thread.finished.connect(self.on_usb_scan_finished)
-            self.usb_device_thread.start()
+            self._start_artifact_worker("USB", UsbDeviceWorker(), self.on_usb_scan_finished)
         elif artifact_name == "REGISTRY":
             if not self.selected_case_path:
                 QMessageBox.warning(self, "No Case Selected", "A case must be selected to perform registry analysis.")
                 return
+            registry_view = self._ensure_registry_view()
             # Update output paths before showing
             self.set_case_path(self.selected_case_path)
-            self._switch_right_panel_view(self.registry_view_container)
+            self._switch_right_panel_view(registry_view)
 
         elif artifact_name == "SRUM":
             self.start_srum_analysis()
@@ -1157,6 +1603,18 @@ class AnalysisPage(BasePage):
             self.placeholder_label.setText(f"{artifact_name} analysis not implemented yet.")
             self._switch_right_panel_view(self.placeholder_label)
 
+    def _start_artifact_worker(self, artifact_name, worker, on_finished):
+        """Run a worker on the shared thread pool, disabling its button until it reports back."""
+        self._artifact_workers[artifact_name] = worker
+        self.artifact_buttons[artifact_name].setEnabled(False)
+        worker.signals.finished.connect(lambda _result: self._on_artifact_worker_done(artifact_name))
+        worker.signals.finished.connect(on_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_artifact_worker_done(self, artifact_name):
+        self._artifact_workers.pop(artifact_name, None)
+        self.artifact_buttons[artifact_name].setEnabled(True)
+
     def start_srum_analysis(self):
         """Initiates the SRUM analysis process with hardcoded paths."""
         if not SRUM_IMPORTS_AVAILABLE:
@@ -1195,162 +1653,165 @@ class AnalysisPage(BasePage):
         }
 
         self.placeholder_label.setText("Analyzing SRUM database... This may take a while.")
+        self.srum_tab_widget.clear()
         self.srum_analysis_thread = SrumAnalysisThread(params)
+        self.srum_analysis_thread.table_ready.connect(self.add_srum_table)
         self.srum_analysis_thread.finished.connect(self.on_srum_analysis_finished)
         self.srum_analysis_thread.start()
 
     def on_srum_analysis_finished(self, result):
         """Handles the finished signal from the SRUM analysis thread."""
         if result["status"] == "success":
-            self.display_srum_data(result['data'])
-            self._switch_right_panel_view(self.srum_tab_widget)
+            # Tables were added as they arrived; only an empty database is left to report
+            if self.srum_tab_widget.count() == 0:
+                self.placeholder_label.setText("No data found in SRUM database.")
+                self._switch_right_panel_view(self.placeholder_label)
         else:
             self.placeholder_label.setText(f"SRUM Analysis Error: {result['message']}")
             self._switch_right_panel_view(self.placeholder_label)
             QMessageBox.critical(self, "SRUM Analysis Failed", result['message'])
 
-    def display_srum_data(self, all_tables_data):
-        """Populates the tab widget with SRUM data with enhanced organization and styling."""
-        self.srum_tab_widget.clear()
-        if not all_tables_data:
-            self.placeholder_label.setText("No data found in SRUM database.")
-            self._switch_right_panel_view(self.placeholder_label)
+    def add_srum_table(self, tname, table_data):
+        """Adds one SRUM table as a styled tab; called as each table finishes decoding."""
+        if not table_data or len(table_data) < 2:  # Skip empty or header-only tables
             return
 
-        for tname, table_data in all_tables_data.items():
-            if not table_data or len(table_data) < 2:  # Skip empty or header-only tables
-                continue
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
 
-            tab = QWidget()
-            layout = QVBoxLayout(tab)
-            layout.setContentsMargins(10, 10, 10, 10)
-            layout.setSpacing(10)
+        # Add header with table info
+        header_frame = QFrame()
+        header_frame.setStyleSheet("background-color: #f8f9fa; border: 1px solid #dee2e6; border-radius: 5px;")
+        header_layout = QHBoxLayout(header_frame)
+
+        # Table info
+        info_label = QLabel(f"<b>Table:</b> {tname} | <b>Records:</b> {len(table_data) - 1}")
+        info_label.setFont(FONT_INFO)
+        header_layout.addWidget(info_label)
+
+        # Export button
+        export_btn = QPushButton("Export to CSV")
+        export_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #28a745; color: white; border: none;
+                border-radius: 4px; padding: 6px 12px; font-weight: bold;
+            }
+            QPushButton:hover { background-color: #218838; }
+        """)
+        export_btn.clicked.connect(lambda checked, data=table_data, name=tname: self.export_srum_csv(data, name))
+        header_layout.addWidget(export_btn)
 
-            # Add header with table info
-            header_frame = QFrame()
-            header_frame.setStyleSheet("background-color: #f8f9fa; border: 1px solid #dee2e6; border-radius: 5px;")
-            header_layout = QHBoxLayout(header_frame)
-            
-            # Table info
-            info_label = QLabel(f"<b>Table:</b> {tname} | <b>Records:</b> {len(table_data) - 1}")
-            info_label.setFont(QFont("Segoe UI", 10))
-            header_layout.addWidget(info_label)
-            
-            # Export button
-            export_btn = QPushButton("Export to CSV")
-            export_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #28a745; color: white; border: none;
-                    border-radius: 4px; padding: 6px 12px; font-weight: bold;
-                }
-                QPushButton:hover { background-color: #218838; }
-            """)
-            export_btn.clicked.connect(lambda checked, data=table_data, name=tname: self.export_srum_csv(data, name))
-            header_layout.addWidget(export_btn)
-            
-            layout.addWidget(header_frame)
+        layout.addWidget(header_frame)
 
-            # Add search functionality
-            search_frame = QFrame()
-            search_frame.setStyleSheet("background-color: #ffffff; border: 1px solid #dee2e6; border-radius: 5px;")
-            search_layout = QHBoxLayout(search_frame)
-            
-            search_label = QLabel("Search:")
-            search_label.setFont(QFont("Segoe UI", 9))
-            search_layout.addWidget(search_label)
-            
-            search_box = QLineEdit()
-            search_box.setPlaceholderText("Type to filter table data...")
-            search_box.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #ced4da; border-radius: 4px; padding: 6px;
-                    font-family: 'Segoe UI'; font-size: 9pt;
-                }
-                QLineEdit:focus { border-color: #80bdff; }
-            """)
-            search_layout.addWidget(search_box, 1)
-            
-            layout.addWidget(search_frame)
-
-            # Create enhanced table
-            table = QTableWidget()
-            table.setSortingEnabled(True)
-            table.setAlternatingRowColors(True)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
-            table.setEditTriggers(QTableWidget.NoEditTriggers)
-            table.verticalHeader().setVisible(False)
-            table.setStyleSheet("""
-                QTableWidget {
-                    gridline-color: #dee2e6; background-color: white;
-                    alternate-background-color: #f8f9fa;
-                    font-family: 'Segoe UI'; font-size: 9pt;
-                }
-                QTableWidget::item {
-                    padding: 6px; border-bottom: 1px solid #dee2e6;
-                }
-                QTableWidget::item:selected {
-                    background-color: #007bff; color: white;
-                }
-                QHeaderView::section {
-                    background-color: #343a40; color: white; padding: 8px;
-                    border: none; font-weight: bold; font-family: 'Segoe UI';
-                }
-                QHeaderView::section:hover {
-                    background-color: #495057;
-                }
-            """)
-
-            headings = table_data[0]
-            table.setColumnCount(len(headings))
-            table.setHorizontalHeaderLabels(headings)
-            table.setRowCount(len(table_data) - 1)
-
-            # Populate table with data
-            for row_idx, row_data in enumerate(table_data[1:]):
-                for col_idx, cell_data in enumerate(row_data):
-                    item = QTableWidgetItem(str(cell_data))
-                    
-                    # Apply special formatting based on content
-                    if cell_data and isinstance(cell_data, str):
-                        # Format timestamps
-                        if any(time_indicator in cell_data.lower() for time_indicator in ['utc', 'gmt', '2023', '2024']):
-                            item.setBackground(QColor(255, 248, 220))  # Light yellow for timestamps
-                        # Format hex values
-                        elif cell_data.startswith('0x') or (len(cell_data) == 8 and all(c in '0123456789abcdefABCDEF' for c in cell_data)):
-                            item.setFont(QFont("Consolas", 9))
-                            item.setBackground(QColor(240, 248, 255))  # Light blue for hex
-                        # Format file paths
-                        elif '\\' in cell_data or '/' in cell_data:
-                            item.setFont(QFont("Consolas", 9))
-                            item.setBackground(QColor(245, 245, 245))  # Light gray for paths
-                    
-                    table.setItem(row_idx, col_idx, item)
-            
-            # Auto-resize columns with smart sizing
-            table.resizeColumnsToContents()
-            table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-            
-            # Set minimum column widths
-            for col in range(table.columnCount()):
-                if table.columnWidth(col) < 100:
-                    table.setColumnWidth(col, 100)
-                elif table.columnWidth(col) > 300:
-                    table.setColumnWidth(col, 300)
-            
-            # Connect search functionality
-            search_box.textChanged.connect(lambda text, t=table: self.filter_srum_table(t, text))
-            
-            layout.addWidget(table, 1)  # Give table most of the space
-            
-            # Add status bar
-            status_bar = QStatusBar()
-            status_bar.setStyleSheet("background-color: #f8f9fa; border-top: 1px solid #dee2e6;")
-            status_label = QLabel(f"Showing {len(table_data) - 1} records")
-            status_label.setFont(QFont("Segoe UI", 9))
-            status_bar.addWidget(status_label)
-            layout.addWidget(status_bar)
-            
-            self.srum_tab_widget.addTab(tab, tname)
+        # Add search functionality
+        search_frame = QFrame()
+        search_frame.setStyleSheet("background-color: #ffffff; border: 1px solid #dee2e6; border-radius: 5px;")
+        search_layout = QHBoxLayout(search_frame)
+
+        search_label = QLabel("Search:")
+        search_label.setFont(FONT_SMALL)
+        search_layout.addWidget(search_label)
+
+        search_box = QLineEdit()
+        search_box.setPlaceholderText("Type to filter table data...")
+        search_box.setStyleSheet("""
+            QLineEdit {
+                border: 1px solid #ced4da; border-radius: 4px; padding: 6px;
+                font-family: 'Segoe UI'; font-size: 9pt;
+            }
+            QLineEdit:focus { border-color: #80bdff; }
+        """)
+        search_layout.addWidget(search_box, 1)
+
+        layout.addWidget(search_frame)
+
+        # Create enhanced table
+        table = QTableWidget()
+        table.setAlternatingRowColors(True)
+        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.setStyleSheet("""
+            QTableWidget {
+                gridline-color: #dee2e6; background-color: white;
+                alternate-background-color: #f8f9fa;
+                font-family: 'Segoe UI'; font-size: 9pt;
+            }
+            QTableWidget::item {
+                padding: 6px; border-bottom: 1px solid #dee2e6;
+            }
+            QTableWidget::item:selected {
+                background-color: #007bff; color: white;
+            }
+            QHeaderView::section {
+                background-color: #343a40; color: white; padding: 8px;
+                border: none; font-weight: bold; font-family: 'Segoe UI';
+            }
+            QHeaderView::section:hover {
+                background-color: #495057;
+            }
+        """)
+
+        headings = table_data[0]
+        table.setColumnCount(len(headings))
+        table.setHorizontalHeaderLabels(headings)
+        table.setRowCount(len(table_data) - 1)
+
+        # Populate with repaints off and sorting deferred; setItem on a sorted table re-sorts per cell
+        table.setUpdatesEnabled(False)
+        for row_idx, row_data in enumerate(table_data[1:]):
+            for col_idx, cell_data in enumerate(row_data):
+                item = QTableWidgetItem(str(cell_data))
+
+                # Apply special formatting based on content
+                if cell_data and isinstance(cell_data, str):
+                    # Format timestamps
+                    if any(time_indicator in cell_data.lower() for time_indicator in ['utc', 'gmt', '2023', '2024']):
+                        item.setBackground(QColor(255, 248, 220))  # Light yellow for timestamps
+                    # Format hex values
+                    elif cell_data.startswith('0x') or (len(cell_data) == 8 and all(c in '0123456789abcdefABCDEF' for c in cell_data)):
+                        item.setFont(FONT_MONO_CELL)
+                        item.setBackground(QColor(240, 248, 255))  # Light blue for hex
+                    # Format file paths
+                    elif '\\' in cell_data or '/' in cell_data:
+                        item.setFont(FONT_MONO_CELL)
+                        item.setBackground(QColor(245, 245, 245))  # Light gray for paths
+
+                table.setItem(row_idx, col_idx, item)
+        table.setSortingEnabled(True)
+        table.setUpdatesEnabled(True)
+
+        # Auto-size columns from the first screenful of rows only; measuring every row is O(rows x cols)
+        srum_header = table.horizontalHeader()
+        srum_header.setSectionResizeMode(QHeaderView.Interactive)
+        srum_header.setResizeContentsPrecision(SRUM_RESIZE_SAMPLE_ROWS)
+        table.resizeColumnsToContents()
+
+        # Set minimum column widths
+        for col in range(table.columnCount()):
+            if table.columnWidth(col) < 100:
+                table.setColumnWidth(col, 100)
+            elif table.columnWidth(col) > 300:
+                table.setColumnWidth(col, 300)
+
+        # Connect search functionality
+        search_box.textChanged.connect(lambda text, t=table: self.filter_srum_table(t, text))
+
+        layout.addWidget(table, 1)  # Give table most of the space
+
+        # Add status bar
+        status_bar = QStatusBar()
+        status_bar.setStyleSheet("background-color: #f8f9fa; border-top: 1px solid #dee2e6;")
+        status_label = QLabel(f"Showing {len(table_data) - 1} records")
+        status_label.setFont(FONT_SMALL)
+        status_bar.addWidget(status_label)
+        layout.addWidget(status_bar)
+
+        self.srum_tab_widget.addTab(tab, tname)
+        if self.srum_tab_widget.count() == 1:
+            self._switch_right_panel_view(self.srum_tab_widget)
 
     def filter_srum_table(self, table, search_text):
         """Filters the SRUM table based on search text."""
@@ -1387,11 +1848,9 @@ class AnalysisPage(BasePage):
         
         if file_path:
             try:
-                with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    # Write all rows including header
-                    for row in table_data:
-                        writer.writerow(row)
+                # Same 1 MiB buffer as the USB export; rows (header first) go out in one writerows call
+                with open(file_path, 'w', newline='', encoding='utf-8', buffering=USB_CSV_BUFFER_SIZE) as csvfile:
+                    csv.writer(csvfile).writerows(table_data)
                 QMessageBox.information(self, "Export Successful", f"SRUM data exported to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Export Failed", f"Failed to export to CSV: {e}")
@@ -1399,7 +1858,7 @@ class AnalysisPage(BasePage):
     def on_web_extraction_finished(self, result):
         """Handle finished signal from the web artifact extraction thread."""
         if result["status"] == "success":
-            self._switch_right_panel_view(self.web_view)
+            self._switch_right_panel_view(self._ensure_web_view())
             self.web_view.setUrl(QUrl.fromLocalFile(result["report_path"]))
         else:
             self._switch_right_panel_view(self.placeholder_label)
@@ -1415,115 +1874,97 @@ class AnalysisPage(BasePage):
             self.placeholder_label.setText("No USB devices found or failed to read registry.")
             self._switch_right_panel_view(self.placeholder_label)
             return
-        
-        self.apply_usb_filters()
+
+        self.display_usb_data(devices)
+        self._recompute_usb_cutoff()
         self._switch_right_panel_view(self.usb_view_container)
 
+    def _recompute_usb_cutoff(self):
+        """Recomputes the time-filter cutoff; only the time combo and a fresh scan move it."""
+        time_delta = USB_TIME_FILTERS[self.usb_time_filter.currentText()]
+        self._usb_cutoff = datetime.utcnow() - time_delta if time_delta else None
+        self.apply_usb_filters()
+
     def apply_usb_filters(self):
         """Filters and displays USB devices based on search and time criteria."""
         if not self.usb_devices:
             return
 
-        search_term = self.usb_search_box.text().lower()
-        time_filter = self.usb_time_filter.currentText()
-        
-        now = datetime.utcnow()
-        time_delta = None
-        if time_filter == "Last 7 Days": time_delta = timedelta(days=7)
-        elif time_filter == "Last 30 Days": time_delta = timedelta(days=30)
-        elif time_filter == "Last 90 Days": time_delta = timedelta(days=90)
-        elif time_filter == "Last Year": time_delta = timedelta(days=365)
-        
-        cutoff_time = now - time_delta if time_delta else None
-
-        filtered_devices = []
-        for device in self.usb_devices:
-            # Time filter
-            if cutoff_time and (not device.get("datetime_obj") or device["datetime_obj"] < cutoff_time):
-                continue
-
-            # Search filter
-            if search_term:
-                matches = False
-                for value in device.values():
-                    if search_term in str(value).lower():
-                        matches = True
-                        break
-                if not matches:
-                    continue
-            
-            filtered_devices.append(device)
-
-        self.display_usb_data(filtered_devices)
+        # The proxy re-filters in place; no rows are rebuilt here
+        self.usb_proxy_model.set_search(self.usb_search_box.text())
+        self.usb_proxy_model.set_cutoff(self._usb_cutoff)
+        self._update_usb_device_count()
 
     def display_usb_data(self, devices):
-        """Populates the table with a list of USB devices."""
-        self.displayed_usb_devices = devices # Store for the details view
-        self.usb_status_bar.showMessage("Populating view...")
-        self.usb_table_view.setSortingEnabled(False)
-        self.usb_table_view.clear()
-        
-        headers = ["Forensic ID", "Description", "Hardware ID", "Plug-in Time", "Duration", "Manufacturer"]
-        self.usb_table_view.setColumnCount(len(headers))
-        self.usb_table_view.setHorizontalHeaderLabels(headers)
-
-        self.usb_table_view.setRowCount(len(devices))
-        for row, device in enumerate(devices):
-            # Populate with new, richer data
-            col_data = [
-                device.get("Forensic ID", ""), device.get("Description", ""), device.get("Hardware ID", ""),
-                device.get("Plug-in Time", ""), device.get("Duration", ""), device.get("Manufacturer", "")
-            ]
-            for col, value in enumerate(col_data):
-                item = QTableWidgetItem(str(value))
-                item.setFont(QFont("Segoe UI", 9))
-                self.usb_table_view.setItem(row, col, item)
-                
-        self.usb_table_view.resizeColumnsToContents()
-        self.usb_table_view.setSortingEnabled(True)
-        connected_count = sum(1 for d in devices if d.get("Connected") == "Yes")
-        self.usb_device_count_label.setText(f"{len(devices)} devices found ({connected_count} connected)")
-        self.usb_status_bar.clearMessage()
+        """Loads a list of USB devices into the table model."""
+        self.usb_table_model.set_devices(devices)
+        self._update_usb_device_count()
+
+    def _visible_usb_rows(self):
+        """Returns the display tuples of the rows currently shown, in view order."""
+        proxy = self.usb_proxy_model
+        cells = self.usb_table_model.cells
+        return [cells(proxy.mapToSource(proxy.index(row, 0)).row()) for row in range(proxy.rowCount())]
+
+    def _update_usb_device_count(self):
+        proxy = self.usb_proxy_model
+        self.usb_device_count_label.setText(f"{proxy.rowCount()} devices found ({proxy.connected_count()} connected)")
     
+    def _usb_device_at(self, index):
+        """Maps a view (proxy) index to the device dict it displays."""
+        return self.usb_table_model.device(self.usb_proxy_model.mapToSource(index).row())
+
     def show_usb_device_details(self, index):
         """Displays a dialog with detailed forensic info for the selected USB device."""
-        if index.row() >= len(self.displayed_usb_devices):
+        if not index.isValid():
             return
 
-        device = self.displayed_usb_devices[index.row()]
+        device = self._usb_device_at(index)
         
-        details_html = "<h3>Forensic Details</h3><ul>"
-        for key, value in sorted(device.items()):
-            if key != "datetime_obj": # Don't show the internal datetime object
-                details_html += f"<li><b>{key.replace('_', ' ').title()}:</b> {value}</li>"
-        details_html += "</ul>"
+        # Don't show internal fields
+        details_html = "".join((
+            "<h3>Forensic Details</h3><ul>",
+            *(f"<li><b>{key.replace('_', ' ').title()}:</b> {value}</li>"
+              for key, value in sorted(device.items())
+              if key not in ("datetime_obj", "_search_blob")),
+            "</ul>",
+        ))
 
         QMessageBox.information(self, f"Details for {device.get('Description', 'Device')}", details_html)
 
     def export_usb_csv(self):
         """Exports the current USB device list to a CSV file."""
-        if not self.displayed_usb_devices:
+        rows = self._visible_usb_rows()
+        if not rows:
             QMessageBox.warning(self, "Export Failed", "No USB devices to export.")
             return
 
         file_path, _ = QFileDialog.getSaveFileName(self, "Export USB Devices", "", "CSV Files (*.csv);;All Files (*)")
-        if file_path:
-            try:
-                with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["Forensic ID", "Description", "Hardware ID", "Plug-in Time", "Duration", "Manufacturer"])
-                    for device in self.displayed_usb_devices:
-                        writer.writerow([
-                            device.get("Forensic ID", ""),
-                            device.get("Description", ""),
-                            device.get("Hardware ID", ""),
-                            device.get("Plug-in Time", ""),
-                            device.get("Duration", ""),
-                            device.get("Manufacturer", "")
-                        ])
-                QMessageBox.information(self, "Export Successful", f"USB devices exported to {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Failed", f"Failed to export to CSV: {e}")
+        if not file_path:
+            return
+        if self.usb_export_thread and self.usb_export_thread.isRunning():
+            QMessageBox.warning(self, "Export In Progress", "Please wait for the current export to finish.")
+            return
+
+        self.export_button.setEnabled(False)
+        self.usb_progress_bar.setRange(0, len(rows))
+        self.usb_progress_bar.setValue(0)
+        self.usb_progress_bar.setVisible(True)
+        self.usb_status_bar.showMessage("Exporting USB devices...")
+        self.usb_export_thread = CsvExportThread(file_path, rows, USB_TABLE_HEADERS, self)
+        self.usb_export_thread.progress.connect(self.usb_progress_bar.setValue)
+        self.usb_export_thread.finished.connect(self.on_usb_export_finished)
+        self.usb_export_thread.start()
+
+    def on_usb_export_finished(self, file_path, error):
+        """Handles the finished signal from the CSV export thread."""
+        self.usb_progress_bar.setVisible(False)
+        self.usb_status_bar.clearMessage()
+        self.export_button.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "Export Failed", f"Failed to export to CSV: {error}")
+        else:
+            QMessageBox.information(self, "Export Successful", f"USB devices exported to {file_path}")
 
     def identify_suspicious_patterns(self, devices):
         """Placeholder for identifying suspicious patterns in USB device data."""
@@ -1545,17 +1986,14 @@ class AnalysisPage(BasePage):
         if not index.isValid():
             return
 
-        device = self.displayed_usb_devices[index.row()]
         menu = QMenu()
-        menu.setFont(QFont("Segoe UI", 9))
+        menu.setFont(FONT_SMALL)  # Actions inherit the menu font
 
         copy_cell_action = QAction("Copy Cell", self)
-        copy_cell_action.setFont(QFont("Segoe UI", 9))
         copy_cell_action.triggered.connect(lambda: self.copy_cell_to_clipboard(index.row(), index.column()))
         menu.addAction(copy_cell_action)
 
         copy_row_action = QAction("Copy Row", self)
-        copy_row_action.setFont(QFont("Segoe UI", 9))
         copy_row_action.triggered.connect(lambda: self.copy_row_to_clipboard(index.row()))
         menu.addAction(copy_row_action)
 
@@ -1563,22 +2001,14 @@ class AnalysisPage(BasePage):
 
     def copy_cell_to_clipboard(self, row, column):
         """Copies the content of a specific cell to the clipboard."""
-        item = self.usb_table_view.item(row, column)
-        if item:
-            QApplication.clipboard().setText(item.text())
+        index = self.usb_proxy_model.index(row, column)
+        if index.isValid():
+            QApplication.clipboard().setText(index.data())
 
     def copy_row_to_clipboard(self, row):
-        """Copies the content of a specific row to the clipboard."""
-        # This method is called by the context menu.
-        # It should copy the entire row's data.
-        # For now, it just copies the first column (Forensic ID) as a placeholder.
-        # A more robust solution would involve copying all columns.
-        row_data = []
-        for col in range(self.usb_table_view.columnCount()):
-            item = self.usb_table_view.item(row, col)
-            if item:
-                row_data.append(item.text())
-        QApplication.clipboard().setText("\n".join(row_data))
+        """Copies a row's columns to the clipboard as one tab-separated line."""
+        source_row = self.usb_proxy_model.mapToSource(self.usb_proxy_model.index(row, 0)).row()
+        QApplication.clipboard().setText("\t".join(self.usb_table_model.cells(source_row)))
 
     def _handle_tab_click(self, clicked_button):
         """Handle tab button clicks"""
@@ -1612,13 +2042,15 @@ class AnalysisPage(BasePage):
         panel.setStyleSheet("background: white; border-radius: 12px; padding: 10px; border: none;")
         
         content_widget = QWidget()
+        # One sheet for every group, hive list and small button below
+        content_widget.setStyleSheet(self._registry_options_style)
         panel.setWidget(content_widget)
         
         layout = QVBoxLayout(content_widget)
         
         # Title
         title = QLabel("Registry Analysis Options")
-        title.setFont(QFont("Cascadia Mono", 16, QFont.Weight.Bold))
+        title.setFont(FONT_PANEL_TITLE)
         title.setStyleSheet(f"color: {COLOR_DARK}; margin-bottom: 15px;")
         layout.addWidget(title)
         
@@ -1645,33 +2077,33 @@ class AnalysisPage(BasePage):
         layout.addStretch()
         return panel
 
-    def _get_group_box_style(self):
-        return f"""
-            QGroupBox {{
-                border: 2px solid {COLOR_DARK};
-                border-radius: 8px;
-                margin-top: 15px;
-                padding: 15px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {COLOR_DARK};
-                font-size: 14px;
-                font-weight: bold;
-            }}
-        """
+    @functools.cached_property
+    def _small_button_style(self):
+        """The standard button style shrunk for inline Browse/List buttons."""
+        style = self.get_button_style(bg_color=COLOR_DARK, text_color="white", hover_color=COLOR_ORANGE)
+        return style.replace("padding: 18px 64px;", "padding: 8px 12px;").replace("font-size: 22px;", "font-size: 14px;")
+
+    @functools.cached_property
+    def _registry_options_style(self):
+        """Stylesheet for the registry options panel; children opt in by object name."""
+        small_buttons = self._small_button_style.replace("QPushButton", "QPushButton#registrySmallButton")
+        return REGISTRY_GROUP_BOX_QSS + REGISTRY_HIVE_LIST_QSS + small_buttons
+
+    def _add_path_row(self, layout, label, placeholder="", is_dir=False):
+        """Adds a label and a path input with a Browse button to layout; returns the input."""
+        layout.addWidget(QLabel(label))
+        row = QHBoxLayout()
+        input_field = self.create_styled_input(placeholder)
+        browse = self.browse_directory if is_dir else self.browse_file
+        row.addWidget(input_field)
+        row.addWidget(self._create_small_browse_button(functools.partial(browse, input_field)))
+        layout.addLayout(row)
+        return input_field
 
     def _create_small_browse_button(self, callback):
         browse_btn = QPushButton("Browse...")
         browse_btn.setFixedSize(100, 44)
-        # Create a smaller version of the standard button style
-        small_button_style = self.get_button_style(bg_color=COLOR_DARK, text_color="white", hover_color=COLOR_ORANGE)
-        small_button_style = small_button_style.replace("padding: 18px 64px;", "padding: 8px 12px;")
-        small_button_style = small_button_style.replace("font-size: 22px;", "font-size: 14px;")
-        browse_btn.setStyleSheet(small_button_style)
+        browse_btn.setObjectName("registrySmallButton")
         browse_btn.clicked.connect(callback)
         return browse_btn
         
@@ -1680,12 +2112,13 @@ class AnalysisPage(BasePage):
         panel.setStyleSheet("background: white; border-radius: 12px; padding: 20px;")
         layout = QVBoxLayout(panel)
         title = QLabel("Progress & Results")
-        title.setFont(QFont("Cascadia Mono", 18, QFont.Weight.Bold))
+        title.setFont(FONT_PROGRESS_TITLE)
         title.setStyleSheet(f"color: {COLOR_DARK}; margin-bottom: 20px;")
         layout.addWidget(title)
         
         self.registry_progress_text = QTextEdit()
         self.registry_progress_text.setReadOnly(True)
+        self.registry_progress_text.document().setMaximumBlockCount(REGISTRY_PROGRESS_MAX_LINES)
         self.registry_progress_text.setStyleSheet(f"""
             QTextEdit {{
                 border: 2px solid {COLOR_DARK};
@@ -1701,8 +2134,7 @@ class AnalysisPage(BasePage):
 
     def create_acquire_hives_group(self):
         group = QGroupBox("1. Acquire Registry Hives")
-        group.setFont(QFont("Cascadia Mono", 12, QFont.Weight.Bold))
-        group.setStyleSheet(self._get_group_box_style())
+        group.setFont(FONT_GROUP)
         
         layout = QVBoxLayout(group)
         layout.setSpacing(10)
@@ -1713,24 +2145,18 @@ class AnalysisPage(BasePage):
         
         layout.addSpacing(10)
         layout.addWidget(QLabel("Select Hives to Acquire:"))
-        self.hive_list = QListWidget()
-        self.hive_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        self.hive_list.setMaximumHeight(150)
-        self.hive_list.setStyleSheet(f"border: 1px solid {COLOR_DARK}; border-radius: 5px; padding: 5px;")
-        
-        available_hives = self.registry_analyzer.get_available_hives()
-        for hive in available_hives:
-            self.hive_list.addItem(QListWidgetItem(hive))
-        layout.addWidget(self.hive_list)
+        self.acquire_hive_model = HiveListModel(self)
+        self.acquire_hive_model.append(self.registry_analyzer.get_available_hives())
+        self.acquire_hive_view = QListView()
+        self.acquire_hive_view.setModel(self.acquire_hive_model)
+        self.acquire_hive_view.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.acquire_hive_view.setUniformItemSizes(True)
+        self.acquire_hive_view.setMaximumHeight(150)
+        self.acquire_hive_view.setObjectName("registryHiveList")
+        layout.addWidget(self.acquire_hive_view)
         
         layout.addSpacing(10)
-        layout.addWidget(QLabel("Output Directory:"))
-        output_layout = QHBoxLayout()
-        self.acquire_output_dir_input = self.create_styled_input()
-        browse_btn = self._create_small_browse_button(lambda: self.browse_directory(self.acquire_output_dir_input))
-        output_layout.addWidget(self.acquire_output_dir_input)
-        output_layout.addWidget(browse_btn)
-        layout.addLayout(output_layout)
+        self.acquire_output_dir_input = self._add_path_row(layout, "Output Directory:", is_dir=True)
         
         layout.addSpacing(15)
         acquire_btn = self.create_styled_button("Acquire Hives", self.acquire_hives)
@@ -1740,34 +2166,33 @@ class AnalysisPage(BasePage):
 
     def create_analyze_hives_group(self):
         group = QGroupBox("2. Analyze Registry Hives")
-        group.setFont(QFont("Cascadia Mono", 12, QFont.Weight.Bold))
-        group.setStyleSheet(self._get_group_box_style())
+        group.setFont(FONT_GROUP)
         layout = QVBoxLayout(group)
         layout.setSpacing(10)
 
-        layout.addWidget(QLabel("Directory of Acquired Hives:"))
-        input_layout = QHBoxLayout()
-        self.analyze_input_dir = self.create_styled_input()
-        browse_input_btn = self._create_small_browse_button(lambda: self.browse_directory(self.analyze_input_dir))
-        input_layout.addWidget(self.analyze_input_dir)
-        input_layout.addWidget(browse_input_btn)
-        layout.addLayout(input_layout)
-
-        populate_btn = QPushButton("List Hives from Directory")
-        small_button_style = self.get_button_style(bg_color=COLOR_DARK, text_color="white", hover_color=COLOR_ORANGE)
-        small_button_style = small_button_style.replace("padding: 18px 64px;", "padding: 8px 12px;").replace("font-size: 22px;", "font-size: 14px;")
-        populate_btn.setStyleSheet(small_button_style)
-        populate_btn.setFixedHeight(44)
-        populate_btn.clicked.connect(self.populate_hives_for_analysis)
-        layout.addWidget(populate_btn, alignment=Qt.AlignLeft)
+        self.analyze_input_dir = self._add_path_row(layout, "Directory of Acquired Hives:", is_dir=True)
+
+        self.populate_hives_btn = QPushButton("List Hives from Directory")
+        self.populate_hives_btn.setObjectName("registrySmallButton")
+        self.populate_hives_btn.setFixedHeight(44)
+        self.populate_hives_btn.clicked.connect(self.populate_hives_for_analysis)
+        layout.addWidget(self.populate_hives_btn, alignment=Qt.AlignLeft)
         
         layout.addSpacing(10)
         layout.addWidget(QLabel("Select Hives to Analyze:"))
-        self.analyze_hive_list = QListWidget()
-        self.analyze_hive_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        self.analyze_hive_list.setMaximumHeight(150)
-        self.analyze_hive_list.setStyleSheet(f"border: 1px solid {COLOR_DARK}; border-radius: 5px; padding: 5px;")
-        layout.addWidget(self.analyze_hive_list)
+        # Model/view: no per-row item objects
+        self.analyze_hive_model = HiveListModel(self)
+        self.analyze_hive_view = QListView()
+        self.analyze_hive_view.setModel(self.analyze_hive_model)
+        self.analyze_hive_view.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.analyze_hive_view.setUniformItemSizes(True)
+        # Lay out large listings in slices between events, and never as draggable icons
+        self.analyze_hive_view.setLayoutMode(QListView.Batched)
+        self.analyze_hive_view.setBatchSize(256)
+        self.analyze_hive_view.setMovement(QListView.Static)
+        self.analyze_hive_view.setMaximumHeight(150)
+        self.analyze_hive_view.setObjectName("registryHiveList")
+        layout.addWidget(self.analyze_hive_view)
 
         layout.addSpacing(15)
         analyze_btn = self.create_styled_button("Analyze Selected Hives", self.analyze_hives)
@@ -1776,36 +2201,17 @@ class AnalysisPage(BasePage):
 
     def create_compare_hives_group(self):
         group = QGroupBox("3. Compare Registry Hives")
-        group.setFont(QFont("Cascadia Mono", 12, QFont.Weight.Bold))
-        group.setStyleSheet(self._get_group_box_style())
+        group.setFont(FONT_GROUP)
         layout = QVBoxLayout(group)
         layout.setSpacing(10)
         
-        layout.addWidget(QLabel("First Hive:"))
-        hive1_layout = QHBoxLayout()
-        self.hive1_input = self.create_styled_input("Path to first hive file")
-        browse1_btn = self._create_small_browse_button(lambda: self.browse_file(self.hive1_input))
-        hive1_layout.addWidget(self.hive1_input)
-        hive1_layout.addWidget(browse1_btn)
-        layout.addLayout(hive1_layout)
+        self.hive1_input = self._add_path_row(layout, "First Hive:", "Path to first hive file")
 
         layout.addSpacing(10)
-        layout.addWidget(QLabel("Second Hive:"))
-        hive2_layout = QHBoxLayout()
-        self.hive2_input = self.create_styled_input("Path to second hive file")
-        browse2_btn = self._create_small_browse_button(lambda: self.browse_file(self.hive2_input))
-        hive2_layout.addWidget(self.hive2_input)
-        hive2_layout.addWidget(browse2_btn)
-        layout.addLayout(hive2_layout)
+        self.hive2_input = self._add_path_row(layout, "Second Hive:", "Path to second hive file")
         
         layout.addSpacing(10)
-        layout.addWidget(QLabel("Output Directory for Report:"))
-        output_layout = QHBoxLayout()
-        self.compare_output_dir = self.create_styled_input()
-        browse3_btn = self._create_small_browse_button(lambda: self.browse_directory(self.compare_output_dir))
-        output_layout.addWidget(self.compare_output_dir)
-        output_layout.addWidget(browse3_btn)
-        layout.addLayout(output_layout)
+        self.compare_output_dir = self._add_path_row(layout, "Output Directory for Report:", is_dir=True)
 
         layout.addSpacing(15)
         compare_btn = self.create_styled_button("Compare Hives", self.compare_hives)
@@ -1815,27 +2221,14 @@ class AnalysisPage(BasePage):
 
     def create_apply_logs_group(self):
         group = QGroupBox("4. Apply Transaction Logs")
-        group.setFont(QFont("Cascadia Mono", 12, QFont.Weight.Bold))
-        group.setStyleSheet(self._get_group_box_style())
+        group.setFont(FONT_GROUP)
         layout = QVBoxLayout(group)
         layout.setSpacing(10)
 
-        layout.addWidget(QLabel("Hive File:"))
-        hive_layout = QHBoxLayout()
-        self.logs_hive_input = self.create_styled_input("Path to hive file (e.g., SYSTEM, NTUSER.DAT)")
-        browse1_btn = self._create_small_browse_button(lambda: self.browse_file(self.logs_hive_input))
-        hive_layout.addWidget(self.logs_hive_input)
-        hive_layout.addWidget(browse1_btn)
-        layout.addLayout(hive_layout)
+        self.logs_hive_input = self._add_path_row(layout, "Hive File:", "Path to hive file (e.g., SYSTEM, NTUSER.DAT)")
         
         layout.addSpacing(10)
-        layout.addWidget(QLabel("Output Directory for Recovered Hive:"))
-        output_layout = QHBoxLayout()
-        self.logs_output_dir = self.create_styled_input()
-        browse2_btn = self._create_small_browse_button(lambda: self.browse_directory(self.logs_output_dir))
-        output_layout.addWidget(self.logs_output_dir)
-        output_layout.addWidget(browse2_btn)
-        layout.addLayout(output_layout)
+        self.logs_output_dir = self._add_path_row(layout, "Output Directory for Recovered Hive:", is_dir=True)
 
         layout.addSpacing(15)
         apply_btn = self.create_styled_button("Apply Transaction Logs", self.apply_transaction_logs)
@@ -1845,18 +2238,11 @@ class AnalysisPage(BasePage):
 
     def create_parse_header_group(self):
         group = QGroupBox("5. Parse Hive Header")
-        group.setFont(QFont("Cascadia Mono", 12, QFont.Weight.Bold))
-        group.setStyleSheet(self._get_group_box_style())
+        group.setFont(FONT_GROUP)
         layout = QVBoxLayout(group)
         layout.setSpacing(10)
         
-        layout.addWidget(QLabel("Hive File:"))
-        hive_layout = QHBoxLayout()
-        self.header_hive_input = self.create_styled_input("Path to hive file to parse")
-        browse_btn = self._create_small_browse_button(lambda: self.browse_file(self.header_hive_input))
-        hive_layout.addWidget(self.header_hive_input)
-        hive_layout.addWidget(browse_btn)
-        layout.addLayout(hive_layout)
+        self.header_hive_input = self._add_path_row(layout, "Hive File:", "Path to hive file to parse")
 
         layout.addSpacing(15)
         parse_btn = self.create_styled_button("Parse Hive Header", self.parse_hive_header)
@@ -1867,28 +2253,83 @@ class AnalysisPage(BasePage):
     def populate_hives_for_analysis(self):
         """Lists hive files from the selected input directory."""
         input_dir = self.analyze_input_dir.text()
-        if not os.path.isdir(input_dir):
+        if not input_dir:
             QMessageBox.warning(self, "Invalid Directory", "Please select a valid directory first.")
             return
-        self.analyze_hive_list.clear()
-        try:
-            for item in os.listdir(input_dir):
-                if os.path.isfile(os.path.join(input_dir, item)):
-                    self.analyze_hive_list.addItem(QListWidgetItem(item))
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not read directory: {e}")
+        if self.hive_scan_worker is not None:
+            return
+        self.analyze_hive_model.clear()
+
+        # Validation and listing both run on the pool, so slow mounts never stall the UI
+        self._hive_scan_path = os.path.abspath(input_dir)
+        worker = HiveDirScanWorker(input_dir, self._hive_scan_cache.get(self._hive_scan_path))
+        worker.signals.started.connect(self._on_hive_dir_started)
+        worker.signals.validated.connect(self._on_hive_dir_validated)
+        worker.signals.batch.connect(self._on_hive_scan_batch)
+        worker.signals.finished.connect(self.on_hive_scan_finished)
+        self.hive_scan_worker = worker
+        self.populate_hives_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _is_current_hive_scan(self):
+        # A scan given up on by _on_hive_dir_timeout may still report in; its results are stale
+        return self.hive_scan_worker is not None and self.sender() is self.hive_scan_worker.signals
+
+    def _on_hive_dir_started(self):
+        # Timed from here, not from start(), so waiting behind other pooled work never counts
+        if self._is_current_hive_scan():
+            self._hive_dir_timer.start()
+
+    def _on_hive_dir_validated(self):
+        if self._is_current_hive_scan():
+            self._hive_dir_timer.stop()
+
+    def _on_hive_dir_timeout(self):
+        """Gives up on a directory that has not answered its stat within HIVE_DIR_TIMEOUT_MS."""
+        self._stale_hive_scans.add(self.hive_scan_worker)
+        self.hive_scan_worker = None
+        self.populate_hives_btn.setEnabled(True)
+        QMessageBox.warning(self, "Directory Unreachable", "The directory is not responding. Check that its drive is connected.")
+
+    def _on_hive_scan_batch(self, names):
+        if self._is_current_hive_scan():
+            self.analyze_hive_model.append(names)
+
+    def on_hive_scan_finished(self, result):
+        """Fills the analysis hive list from a finished directory scan."""
+        if not self._is_current_hive_scan():
+            self._stale_hive_scans = {w for w in self._stale_hive_scans if w.signals is not self.sender()}
+            return
+        self._hive_dir_timer.stop()
+        self.hive_scan_worker = None
+        self.populate_hives_btn.setEnabled(True)
+        names, error, mtime_ns = result
+        if mtime_ns is None:
+            QMessageBox.warning(self, "Invalid Directory", "Please select a valid directory first.")
+            return
+        if error is not None:
+            self.analyze_hive_model.clear()  # Drop any batches streamed before the failure
+            QMessageBox.critical(self, "Error", f"Could not read directory: {error}")
+            return
+        # The names are already on screen from the streamed batches
+        abs_path = self._hive_scan_path
+        self._hive_scan_cache.pop(abs_path, None)
+        if len(self._hive_scan_cache) >= HIVE_SCAN_CACHE_SIZE:
+            del self._hive_scan_cache[next(iter(self._hive_scan_cache))]  # Oldest first
+        self._hive_scan_cache[abs_path] = (mtime_ns, names)
 
     def acquire_hives(self):
         """Handles the logic for acquiring selected hives."""
-        selected_items = self.hive_list.selectedItems()
-        if not selected_items:
+        # Selected rows come straight from the selection model, without visiting unselected rows
+        selected_rows = self.acquire_hive_view.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, "Missing Information", "Please select at least one hive to acquire.")
             return
         output_dir = self.acquire_output_dir_input.text()
         if not output_dir:
             QMessageBox.warning(self, "Missing Information", "Please specify an output directory.")
             return
-        selected_hives = [item.text() for item in selected_items]
+        selected_hives = [self.acquire_hive_model.name(index.row()) for index in selected_rows]
         username = self.username_input.text()
         self.start_registry_operation("acquire_registry_hives", {
             'output_dir': output_dir,
@@ -1898,11 +2339,11 @@ class AnalysisPage(BasePage):
 
     def analyze_hives(self):
         """Handles the logic for analyzing selected hives."""
-        selected_items = self.analyze_hive_list.selectedItems()
-        if not selected_items:
+        selected_rows = self.analyze_hive_view.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, "Missing Information", "Please select at least one hive to analyze.")
             return
-        selected_hives = [item.text() for item in selected_items]
+        selected_hives = [self.analyze_hive_model.name(index.row()) for index in selected_rows]
         analysis_dir = os.path.join(self.selected_case_path, "registry_analysis", "analysis_results")
         self.start_registry_operation("analyze_registry_hive", {
             'input_dir': self.analyze_input_dir.text(),
@@ -1944,77 +2385,136 @@ class AnalysisPage(BasePage):
             return
         self.start_registry_operation("parse_hive_header", {'hive_path': hive_path})
 
+    @functools.cached_property
+    def _browse_dialog(self):
+        """One file dialog shared by every Browse button."""
+        dialog = QFileDialog(self)
+        dialog.setNameFilter("All Files (*)")
+        return dialog
+
+    def _browse_into(self, input_field, title, file_mode):
+        dialog = self._browse_dialog
+        dialog.setWindowTitle(title)
+        dialog.setFileMode(file_mode)
+        dialog.setOption(QFileDialog.ShowDirsOnly, file_mode == QFileDialog.Directory)
+        if dialog.exec_() and dialog.selectedFiles():
+            input_field.setText(dialog.selectedFiles()[0])
+
     def browse_directory(self, input_field):
         """Opens a dialog to select a directory and sets the path to the input field."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
-        if directory:
-            input_field.setText(directory)
+        self._browse_into(input_field, "Select Directory", QFileDialog.Directory)
 
     def browse_file(self, input_field):
         """Opens a dialog to select a file and sets the path to the input field."""
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select Hive File", "", "All Files (*)")
-        if file_path:
-            input_field.setText(file_path)
+        self._browse_into(input_field, "Select Hive File", QFileDialog.ExistingFile)
 
     def start_registry_operation(self, operation, kwargs):
-        if self.registry_worker_thread and self.registry_worker_thread.isRunning():
-            QMessageBox.warning(self, "In Progress", "Another registry operation is in progress.")
+        if self.registry_worker is not None:
+            # Run it after the current one instead of turning the user away
+            if len(self._registry_op_queue) >= REGISTRY_OPERATION_QUEUE_SIZE:
+                QMessageBox.warning(self, "In Progress", "Too many registry operations are already waiting.")
+                return
+            self._registry_op_queue.append((operation, kwargs))
+            self.update_registry_progress(f"Queued: {operation.replace('_', ' ').title()}")
             return
-        
+
         self.registry_progress_text.clear()
-        self.registry_worker_thread = RegistryWorker(self.registry_analyzer, operation, **kwargs)
-        self.registry_worker_thread.progress_updated.connect(self.update_registry_progress)
-        self.registry_worker_thread.operation_completed.connect(self.handle_registry_operation_completed)
-        self.registry_worker_thread.header_output.connect(self.display_header_output)
-        self.registry_worker_thread.start()
+        self._registry_progress_buffer.clear()
+        self._run_registry_operation(operation, kwargs)
+
+    def _run_registry_operation(self, operation, kwargs):
+        self.registry_worker = RegistryWorker(self.registry_analyzer, operation, **kwargs)
+        signals = self.registry_worker.signals
+        signals.progress_updated.connect(self.update_registry_progress)
+        signals.operation_completed.connect(self.handle_registry_operation_completed)
+        signals.header_output.connect(self.display_header_output)
+        QThreadPool.globalInstance().start(self.registry_worker)
 
     def update_registry_progress(self, message):
-        self.registry_progress_text.append(message)
+        """Queue a progress line for the next _flush_registry_progress."""
+        self._registry_progress_buffer.append(message)
+        if not self._registry_progress_timer.isActive():
+            self._registry_progress_timer.start()
+
+    def _flush_registry_progress(self):
+        if not self._registry_progress_buffer:
+            return
+        text = "\n".join(self._registry_progress_buffer)
+        self._registry_progress_buffer.clear()
+        log = self.registry_progress_text
+        if not log.document().isEmpty():
+            text = "\n" + text
+        scrollbar = log.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        # Plain insert through a cursor of our own, so the user's cursor and selection are left alone
+        cursor = QTextCursor(log.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def handle_registry_operation_completed(self, operation, success, message):
+        self.registry_worker = None
         status = "SUCCESS" if success else "FAILED"
-        self.registry_progress_text.append(f"--- [{datetime.now().strftime('%H:%M:%S')}] {operation.replace('_', ' ').title()} {status} ---")
+        self.update_registry_progress(f"--- [{time.strftime('%H:%M:%S')}] {operation.replace('_', ' ').title()} {status} ---")
         if not success:
-             self.registry_progress_text.append(f"Error: {message}\n")
+             self.update_registry_progress(f"Error: {message}\n")
         else:
-             self.registry_progress_text.append(f"Details: {message}\n")
+             self.update_registry_progress(f"Details: {message}\n")
+
+        # Queued operations append to this log rather than clearing it
+        if self._registry_op_queue:
+            self._run_registry_operation(*self._registry_op_queue.popleft())
         
         # No popup for every operation, progress text is enough
         # QMessageBox.information(self, f"Operation {status}", message)
 
     def display_header_output(self, output):
         """Display header parsing output in a formatted way"""
-        self.registry_progress_text.append("=" * 60)
-        self.registry_progress_text.append("REGISTRY HIVE HEADER ANALYSIS")
-        self.registry_progress_text.append("=" * 60)
-        self.registry_progress_text.append(output)
-        self.registry_progress_text.append("=" * 60)
-        self.registry_progress_text.append("")  # Add empty line for spacing
-
-class RegistryWorker(QThread):
-    """Worker thread for registry operations"""
+        # Queued with the progress lines so the report stays in order
+        self.update_registry_progress("=" * 60)
+        self.update_registry_progress("REGISTRY HIVE HEADER ANALYSIS")
+        self.update_registry_progress("=" * 60)
+        self.update_registry_progress(output)
+        self.update_registry_progress("=" * 60)
+        self.update_registry_progress("")  # Add empty line for spacing
+
+class RegistryWorkerSignals(QObject):
+    """Signals for RegistryWorker, which as a QRunnable cannot emit itself."""
     progress_updated = pyqtSignal(str)
     operation_completed = pyqtSignal(str, bool, str)
     header_output = pyqtSignal(str)  # For header parsing output
+
+class RegistryWorker(QRunnable):
+    """Pooled worker for registry operations"""
     
     def __init__(self, analyzer, operation, **kwargs):
         super().__init__()
         self.analyzer = analyzer
         self.operation = operation
         self.kwargs = kwargs
+        self.signals = RegistryWorkerSignals()
         
-        # Connect the analyzer's signals to our signals
-        self.analyzer.progress_updated.connect(self.progress_updated.emit)
-        self.analyzer.operation_completed.connect(self.operation_completed.emit)
-        self.analyzer.header_output.connect(self.header_output.emit)
+        # Forward progress/header only; run() emits completion, so forwarding it too reported it twice
+        self.analyzer.progress_updated.connect(self.signals.progress_updated)
+        self.analyzer.header_output.connect(self.signals.header_output)
         
     def run(self):
         # This will call the appropriate method on the RegistryAnalyzer instance
         operation_func = getattr(self.analyzer, self.operation, None)
-        if operation_func:
-            # We need to unpack the kwargs dict to pass them as arguments
-            success, message = operation_func(**self.kwargs)
-            self.operation_completed.emit(self.operation, success, message)
+        try:
+            if operation_func:
+                # We need to unpack the kwargs dict to pass them as arguments
+                success, message = operation_func(**self.kwargs)
+            else:
+                success, message = False, f"Unknown registry operation: {self.operation}"
+        except Exception as e:
+            success, message = False, str(e)
+        finally:
+            # The analyzer is shared; drop our forwards so the next worker's aren't doubled up
+            self.analyzer.progress_updated.disconnect(self.signals.progress_updated)
+            self.analyzer.header_output.disconnect(self.signals.header_output)
+        self.signals.operation_completed.emit(self.operation, success, message)
 
 if __name__ == '__main__':
     import sys
@@ -0,0 +1,312 @@
+import os
+import struct
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("winreg")  # services.usb_analyzer reads the Windows registry
+from pages import analysis_page
+from pages.analysis_page import SRUM_IMPORTS_AVAILABLE
+
+
+class FakeColumn:
+    def __init__(self, name, column_type):
+        self.name = name
+        self.type = column_type
+
+
+class FakeRecord:
+    def __init__(self, table, values):
+        self._table = table
+        self._values = values
+
+    def get_column_type(self, column_number):
+        return self._table.columns[column_number].type
+
+    def get_value_data(self, column_number):
+        return self._values[column_number]
+
+
+class FakeEseTable:
+    """The slice of pyesedb.table that SrumAnalyzer reads."""
+
+    def __init__(self, name, columns, rows):
+        self.name = name
+        self.columns = columns
+        self._rows = rows
+
+    @property
+    def number_of_columns(self):
+        return len(self.columns)
+
+    @property
+    def number_of_records(self):
+        return len(self._rows)
+
+    def get_record(self, record_number):
+        return FakeRecord(self, self._rows[record_number])
+
+
+@pytest.fixture
+def srum_analyzer():
+    if not SRUM_IMPORTS_AVAILABLE:
+        pytest.skip("pyesedb, openpyxl and python-registry are required for SRUM analysis")
+    analyzer = analysis_page.SrumAnalyzer("SRUDB.dat", "template.xlsx")
+    analyzer.template_tables = {
+        "{APP}": ("App Timeline", {
+            "AppId": ("Normal", "lookup_id", "Application"),
+            "Flags": ("Normal", "base16", "Flags"),
+        }),
+        "{STALE}": ("Stale Template", {"Missing": ("Normal", None, "Missing")}),
+    }
+    analyzer.id_table = {7: "explorer.exe"}
+    return analyzer
+
+
+def srum_table(name):
+    types = analysis_page.pyesedb.column_types
+    columns = [
+        FakeColumn("AutoIncId", types.INTEGER_32BIT_SIGNED),
+        FakeColumn("AppId", types.INTEGER_32BIT_SIGNED),
+        FakeColumn("Extra", types.INTEGER_32BIT_UNSIGNED),
+        FakeColumn("Flags", types.INTEGER_32BIT_UNSIGNED),
+    ]
+    rows = [
+        [struct.pack("<i", 1), struct.pack("<i", 7), struct.pack("<I", 99), struct.pack("<I", 255)],
+        [struct.pack("<i", 2), struct.pack("<i", 8), None, None],
+    ]
+    return FakeEseTable(name, columns, rows)
+
+
+def test_templated_table_shows_only_template_columns(srum_analyzer):
+    tname, rows = srum_analyzer._process_one_table(srum_table("{APP}"))
+
+    assert tname == "App Timeline"
+    assert rows[0] == ["Application", "Flags"]
+    assert rows[1:] == [["explorer.exe", "0xff"], ["Unknown ID (8)", "Empty"]]
+    assert all(len(row) == len(rows[0]) for row in rows)
+
+
+@pytest.mark.parametrize("table_name", ["{UNTEMPLATED}", "{STALE}"])
+def test_table_without_matching_template_columns_shows_every_column(srum_analyzer, table_name):
+    _, rows = srum_analyzer._process_one_table(srum_table(table_name))
+
+    assert rows[0] == ["AutoIncId", "AppId", "Extra", "Flags"]
+    assert rows[1:] == [["1", "7", "99", "255"], ["2", "8", "Empty", "Empty"]]
+
+
+def test_table_without_records_is_skipped(srum_analyzer):
+    table = srum_table("{APP}")
+    table._rows = []
+    assert srum_analyzer._process_one_table(table) is None
+
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+def usb_device(forensic_id, description, manufacturer, days_ago, connected):
+    return {
+        "Forensic ID": forensic_id,
+        "Description": description,
+        "Hardware ID": f"USB\\VID_0951&PID_{forensic_id}",
+        "Plug-in Time": "",
+        "Duration": "",
+        "Manufacturer": manufacturer,
+        "Connected": "Yes" if connected else "No",
+        "datetime_obj": None if days_ago is None else NOW - timedelta(days=days_ago),
+    }
+
+
+@pytest.fixture
+def usb_proxy(monkeypatch):
+    devices = [
+        usb_device("A1", "DataTraveler 2020", "Kingston", 1, True),
+        usb_device("B2", "Ultra Fit", "SanDisk", 3, False),
+        usb_device("C3", "DataTraveler Max", "Kingston", 40, True),
+        usb_device("D4", "Cruzer 2020", "SanDisk", 2, True),
+        usb_device("E5", "Unknown Kingston stick", "Kingston", None, True),
+    ]
+    # Run the scan worker's indexing and sorting over a fixed device list
+    monkeypatch.setattr(analysis_page, "get_usb_devices", lambda: devices)
+    worker = analysis_page.UsbDeviceWorker()
+    scanned = []
+    worker.signals.finished.connect(scanned.append)
+    worker.run()
+
+    model = analysis_page.UsbTableModel()
+    proxy = analysis_page.UsbFilterProxyModel()
+    proxy.setSourceModel(model)
+    model.set_devices(scanned[0])
+    proxy.model = model  # Keep the source model alive for the test
+    return proxy
+
+
+def visible_ids(proxy):
+    model = proxy.sourceModel()
+    return sorted(
+        model.device(proxy.mapToSource(proxy.index(row, 0)).row())["Forensic ID"]
+        for row in range(proxy.rowCount())
+    )
+
+
+def test_unfiltered_proxy_shows_every_device(usb_proxy):
+    assert visible_ids(usb_proxy) == ["A1", "B2", "C3", "D4", "E5"]
+    assert usb_proxy.connected_count() == 4
+
+
+def test_search_needs_every_word_in_any_field(usb_proxy):
+    usb_proxy.set_search("  kingston   2020 ")
+    assert visible_ids(usb_proxy) == ["A1"]
+
+    usb_proxy.set_search("DATATRAVELER")
+    assert visible_ids(usb_proxy) == ["A1", "C3"]
+    assert usb_proxy.connected_count() == 2
+
+
+def test_cutoff_hides_older_and_undated_devices(usb_proxy):
+    usb_proxy.set_cutoff(NOW - timedelta(days=7))
+    assert visible_ids(usb_proxy) == ["A1", "B2", "D4"]
+    assert usb_proxy.connected_count() == 2
+
+    usb_proxy.set_cutoff(None)
+    assert visible_ids(usb_proxy) == ["A1", "B2", "C3", "D4", "E5"]
+    assert usb_proxy.connected_count() == 4
+
+
+def test_search_and_cutoff_combine(usb_proxy):
+    usb_proxy.set_search("2020")
+    usb_proxy.set_cutoff(NOW - timedelta(days=7))
+    assert visible_ids(usb_proxy) == ["A1", "D4"]
+    assert usb_proxy.connected_count() == 2
+
+    usb_proxy.set_search("kingston")
+    assert visible_ids(usb_proxy) == ["A1"]
+    assert usb_proxy.connected_count() == 1
+
+    usb_proxy.set_cutoff(NOW - timedelta(days=60))
+    assert visible_ids(usb_proxy) == ["A1", "C3"]
+    assert usb_proxy.connected_count() == 2
+
+
+def test_reloading_devices_refilters_and_recounts(usb_proxy):
+    usb_proxy.set_search("sandisk")
+    assert usb_proxy.connected_count() == 1
+
+    model = usb_proxy.sourceModel()
+    model.set_devices([dict(model.device(row)) for row in range(model.rowCount())])
+    assert visible_ids(usb_proxy) == ["B2", "D4"]
+    assert usb_proxy.connected_count() == 1
+
+
+def run_hive_scan(path, cached=None):
+    worker = analysis_page.HiveDirScanWorker(str(path), cached)
+    events = []
+    worker.signals.started.connect(lambda: events.append("started"))
+    worker.signals.validated.connect(lambda: events.append("validated"))
+    worker.signals.batch.connect(lambda names: events.append(list(names)))
+    finished = []
+    worker.signals.finished.connect(finished.append)
+    worker.run()
+    return events, finished[0]
+
+
+def touch(directory, *names):
+    for name in names:
+        (directory / name).write_bytes(b"")
+
+
+def test_is_hive_file_name():
+    assert analysis_page.is_hive_file_name("system")
+    assert analysis_page.is_hive_file_name("NTUSER.DAT")
+    assert analysis_page.is_hive_file_name("ntuser.dat.LOG1")
+    assert analysis_page.is_hive_file_name("SOFTWARE.LOG2")
+    assert not analysis_page.is_hive_file_name("notes.txt")
+    assert not analysis_page.is_hive_file_name("SYSTEM.bak")
+
+
+def test_hive_scan_lists_only_hives_and_their_logs(tmp_path):
+    touch(tmp_path, "SYSTEM", "SYSTEM.LOG1", "NTUSER.DAT", "notes.txt")
+    (tmp_path / "SAM").mkdir()
+
+    events, (names, error, mtime_ns) = run_hive_scan(tmp_path)
+
+    assert error is None
+    assert mtime_ns == os.stat(tmp_path).st_mtime_ns
+    assert sorted(names) == ["NTUSER.DAT", "SYSTEM", "SYSTEM.LOG1"]
+    assert events[:2] == ["started", "validated"]
+    assert sorted(name for batch in events[2:] for name in batch) == sorted(names)
+
+
+def test_hive_scan_falls_back_to_every_file_without_hives(tmp_path):
+    touch(tmp_path, "renamed_system.bin", "user_hive")
+    (tmp_path / "subdir").mkdir()
+
+    events, (names, error, _) = run_hive_scan(tmp_path)
+
+    assert error is None
+    assert sorted(names) == ["renamed_system.bin", "user_hive"]
+    assert sorted(name for batch in events[2:] for name in batch) == sorted(names)
+
+
+def test_hive_scan_streams_large_directories_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis_page, "HIVE_SCAN_BATCH_SIZE", 2)
+    touch(tmp_path, "SYSTEM", "SOFTWARE", "SAM", "SECURITY", "DEFAULT")
+
+    events, (names, _, _) = run_hive_scan(tmp_path)
+
+    batches = events[2:]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(name for batch in batches for name in batch) == sorted(names)
+
+
+def test_hive_scan_reuses_cached_names_while_directory_is_unchanged(tmp_path):
+    touch(tmp_path, "SYSTEM")
+    mtime_ns = os.stat(tmp_path).st_mtime_ns
+
+    events, (names, error, scanned_mtime) = run_hive_scan(tmp_path, (mtime_ns, ["CACHED"]))
+
+    assert (names, error, scanned_mtime) == (["CACHED"], None, mtime_ns)
+    assert events == ["started", "validated", ["CACHED"]]
+
+
+def test_hive_scan_rescans_when_directory_changed(tmp_path):
+    touch(tmp_path, "SYSTEM")
+    stale_mtime = os.stat(tmp_path).st_mtime_ns - 1
+
+    _, (names, _, mtime_ns) = run_hive_scan(tmp_path, (stale_mtime, ["CACHED"]))
+
+    assert names == ["SYSTEM"]
+    assert mtime_ns == os.stat(tmp_path).st_mtime_ns
+
+
+def test_hive_scan_reports_missing_directory(tmp_path):
+    events, (names, error, mtime_ns) = run_hive_scan(tmp_path / "missing")
+
+    assert (names, mtime_ns) == ([], None)
+    assert isinstance(error, FileNotFoundError)
+    assert events == ["started"]
+
+
+def test_hive_scan_reports_a_file_as_not_a_directory(tmp_path):
+    touch(tmp_path, "SYSTEM")
+
+    events, (names, error, mtime_ns) = run_hive_scan(tmp_path / "SYSTEM")
+
+    assert (names, mtime_ns) == ([], None)
+    assert isinstance(error, NotADirectoryError)
+
+
+def test_hive_list_model_appends_batches():
+    model = analysis_page.HiveListModel()
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    model.append(["SYSTEM", "SAM"])
+    model.append([])
+    model.append(["SOFTWARE"])
+
+    assert inserted == [(0, 1), (2, 2)]
+    assert [model.name(row) for row in range(model.rowCount())] == ["SYSTEM", "SAM", "SOFTWARE"]
+    assert model.data(model.index(2)) == "SOFTWARE"
+    model.clear()
+    assert model.rowCount() == 0
@@ -0,0 +1,23 @@
+import pytest
+
+from config import get_config
+
+
+def test_to_dict_returns_an_independent_copy():
+    config = get_config()
+    data = config.to_dict()
+    data["api"]["timeout"] = -1
+    data["extra"] = {}
+
+    fresh = config.to_dict()
+    assert fresh["api"]["timeout"] == config.api.timeout
+    assert "extra" not in fresh
+    assert "password" not in fresh["database"]
+
+
+def test_as_dict_is_read_only():
+    config = get_config()
+    with pytest.raises(TypeError):
+        config.as_dict["api"]["timeout"] = -1
+    with pytest.raises(TypeError):
+        config.as_dict["extra"] = {}
@@ -0,0 +1,136 @@
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from models import data_models
+from models.data_models import (
+    Case, CaseStatus, Evidence, EvidenceTable, EvidenceType, Location,
+    bulk_dict_to_case, bulk_dict_to_evidence, case_to_dict, case_to_json,
+    dict_to_case, dict_to_evidence, evidence_to_dict, evidence_to_json,
+    json_to_cases, json_to_evidence
+)
+
+
+def make_case():
+    return Case(
+        number="2024-017",
+        name="Laptop seizure \u00e9t\u00e9 \u2013 \"quoted\"",
+        status=CaseStatus.ACTIVE,
+        created_at=datetime(2024, 5, 1, 9, 30),
+        updated_at=datetime(2024, 5, 2, 10, 0, 5),
+        created_by="analyst",
+        description=None,
+        evidence=[Evidence(), Evidence()],
+        locations=[Location(path="C:\\cases")],
+        metadata={"source": "\u65e5\u672c", "n": 3, "nested": [1, None]},
+        tags=["usb", "\u00fc"]
+    )
+
+
+def make_evidence():
+    return Evidence(
+        name="NTUSER.DAT",
+        type=EvidenceType.REGISTRY,
+        locations=[Location(path="D:\\hives\\NTUSER.DAT", size=1024, metadata={"k": "\u00e9"})],
+        acquired_at=datetime(2024, 5, 1, 12, 0),
+        hash="abc123",
+        size=1024,
+        tags=["hive"]
+    )
+
+
+def compact(data):
+    return json.dumps(data, separators=(",", ":"))
+
+
+def test_case_to_json_matches_case_to_dict():
+    case = make_case()
+    assert case_to_json(case) == compact(case_to_dict(case))
+
+
+@pytest.mark.parametrize("acquired_at", [datetime(2024, 5, 1, 12, 0), None])
+def test_evidence_to_json_matches_evidence_to_dict(acquired_at):
+    evidence = make_evidence()
+    evidence.acquired_at = acquired_at
+    assert evidence_to_json(evidence) == compact(evidence_to_dict(evidence))
+
+
+def test_enum_values_read_as_plain_strings():
+    data = case_to_dict(make_case())
+    assert str(data["status"]) == f"{data['status']}" == "active"
+    assert str(evidence_to_dict(make_evidence())["type"]) == "registry"
+
+
+def test_case_round_trips_through_json():
+    case = make_case()
+    restored = dict_to_case(json.loads(case_to_json(case)))
+    expected = case_to_dict(case)
+    expected.update(evidence_count=0, locations_count=0)
+    assert case_to_dict(restored) == expected
+
+
+def test_evidence_round_trips_through_json():
+    evidence = make_evidence()
+    restored = dict_to_evidence(json.loads(evidence_to_json(evidence)))
+    assert evidence_to_dict(restored) == evidence_to_dict(evidence)
+
+
+@pytest.mark.parametrize("loads", [json.loads, pytest.param("orjson", id="orjson")])
+def test_json_ingest_matches_single_row_converters(monkeypatch, loads):
+    if loads == "orjson":
+        loads = pytest.importorskip("orjson").loads
+    monkeypatch.setattr(data_models, "_json_loads", loads)
+    cases = [make_case(), make_case()]
+    evidence = [make_evidence(), make_evidence()]
+    case_payload = "[" + ",".join(case_to_json(case) for case in cases) + "]"
+    evidence_payload = "[" + ",".join(evidence_to_json(item) for item in evidence) + "]"
+
+    assert [case_to_dict(case) for case in json_to_cases(case_payload)] == \
+        [case_to_dict(dict_to_case(row)) for row in json.loads(case_payload)]
+    assert [evidence_to_dict(item) for item in json_to_evidence(evidence_payload)] == \
+        [evidence_to_dict(item) for item in evidence]
+
+
+def test_bulk_converters_match_single_row_converters():
+    case_rows = [case_to_dict(make_case()), {"status": "archived", "name": "minimal"}]
+    evidence_rows = [evidence_to_dict(make_evidence()), {"type": "log"}]
+
+    bulk_cases = bulk_dict_to_case(case_rows)
+    single_cases = [dict_to_case(row) for row in case_rows]
+    assert case_to_dict(bulk_cases[0]) == case_to_dict(single_cases[0])
+    assert (bulk_cases[1].status, bulk_cases[1].name) == (CaseStatus.ARCHIVED, "minimal")
+    assert [evidence_to_dict(item) for item in bulk_dict_to_evidence(evidence_rows[:1])] == \
+        [evidence_to_dict(dict_to_evidence(evidence_rows[0]))]
+    assert bulk_dict_to_evidence(evidence_rows[1:])[0].type is EvidenceType.LOG
+
+
+def test_bulk_converters_reject_unknown_enum_values():
+    with pytest.raises(ValueError):
+        bulk_dict_to_case([{"status": "deleted"}])
+    with pytest.raises(ValueError):
+        bulk_dict_to_evidence([{"type": "disk"}])
+
+
+def test_evidence_table_round_trip_and_queries():
+    rows = [
+        Evidence(name="a", type=EvidenceType.FILE, size=10, hash="h1"),
+        Evidence(name="b", type=EvidenceType.MEMORY, size=None),
+        Evidence(name="c", type=EvidenceType.FILE, size=5),
+    ]
+    table = EvidenceTable.from_rows(rows)
+
+    assert len(table) == 3
+    assert table.total_size() == 15
+    assert table.indices_of_type(EvidenceType.FILE) == [0, 2]
+    assert table.count_by_type() == {EvidenceType.FILE: 2, EvidenceType.MEMORY: 1}
+    restored = table.to_rows()
+    assert [(e.id, e.name, e.type, e.size, e.hash) for e in restored] == \
+        [(e.id, e.name, e.type, e.size, e.hash) for e in rows]
+
+
+def test_generated_ids_are_canonical_uuids():
+    ids = [Case().id, Evidence().id, dict_to_case({}).id, bulk_dict_to_evidence([{}])[0].id]
+    assert all(str(uuid.UUID(item_id)) == item_id for item_id in ids)
+    assert len(set(ids)) == len(ids)